@@ -1,19 +1,25 @@
 import os
 import sys
 import json
-import threading
 import time
-from datetime import datetime
+import hashlib
 from pathlib import Path
 import asyncio
-import nest_asyncio
-from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, suppress
 import logging
 import math
 
-from flask import Flask, render_template, jsonify
-from flask_cors import CORS
+import numpy as np
+import orjson
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
+from fastapi.staticfiles import StaticFiles
+from fastapi.templating import Jinja2Templates
+from starlette.concurrency import run_in_threadpool
 from dotenv import load_dotenv
+from jinja2 import FileSystemBytecodeCache
 
 # Configure logging
 logging.basicConfig(
@@ -27,17 +33,16 @@ project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
 from src.utils.twitter_scraper import TwitterScraper
-from src.utils.database import save_twitter_stats, get_latest_leaderboard, get_historical_data, import_existing_json_data, cleanup_json_files
-
-# Enable nested event loops
-nest_asyncio.apply()
+from src.utils.database import init_db, save_twitter_stats_bulk, get_latest_leaderboard, get_historical_data, import_existing_json_data, cleanup_json_files
 
 # Load environment variables
 load_dotenv(project_root / 'config' / '.env')
 
-# Initialize Flask app
-app = Flask(__name__)
-CORS(app)
+# Dev-only behaviour (template auto-reload, tracebacks) is opt-in
+DEBUG = os.getenv('APP_DEBUG', '').lower() in ('1', 'true', 'yes')
+
+# (divisor, suffix) for each power of 1000 handled by format_number
+NUMBER_SUFFIXES = ((1, ''), (1_000, 'K'), (1_000_000, 'M'), (1_000_000_000, 'B'))
 
 # Add custom Jinja2 filters
 def format_number(value):
@@ -46,44 +51,69 @@ def format_number(value):
         return "0"
     
     value = float(value)
-    if value >= 1_000_000_000:
-        return f"{value/1_000_000_000:.1f}B"
-    elif value >= 1_000_000:
-        return f"{value/1_000_000:.1f}M"
-    elif value >= 1_000:
-        return f"{value/1_000:.1f}K"
-    else:
+    if value < 1_000:
         return f"{value:,.0f}"
-
-app.jinja_env.filters['format_number'] = format_number
+    
+    # nan and inf have no decimal exponent; format them as the ladder did
+    if not math.isfinite(value):
+        return f"{value:,.0f}" if math.isnan(value) else f"{value/1_000_000_000:.1f}B"
+    
+    # Pick the suffix bucket from the decimal exponent instead of a branch ladder
+    bucket = min(int(math.log10(value)) // 3, len(NUMBER_SUFFIXES) - 1)
+    divisor, suffix = NUMBER_SUFFIXES[bucket]
+    if value < divisor:
+        # Guard against log10 rounding up just below a power of 1000
+        divisor, suffix = NUMBER_SUFFIXES[bucket - 1]
+    return f"{value/divisor:.1f}{suffix}"
 
 # Setup paths
 DATA_DIR = project_root / 'src' / 'data'
 LOG_DIR = project_root / 'src' / 'logs'
+TEMPLATES_DIR = project_root / 'src' / 'templates'
+STATIC_DIR = project_root / 'src' / 'static'
+JINJA_CACHE_DIR = LOG_DIR / '.jinja_cache'
+
+# Growth status labels, indexed by determine_growth_statuses
+GROWTH_STATUSES = np.array(['🚀 Spiking', '📈 Fast Growth', '↗️ Growing', '↘️ Declining', '➡️ Stable'])
+SPIKING_STATUS = str(GROWTH_STATUSES[0])
+
+# Shared read-only default for missing nested dicts (never mutated)
+EMPTY = {}
 
 # Create directories if they don't exist
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 LOG_DIR.mkdir(parents=True, exist_ok=True)
+JINJA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
 # Global variables to store leaderboard data
-current_leaderboard = []  # Initialize as empty list
-last_update = None
+# Display format for update timestamps, and a fallback captured once at startup
+# for requests served before the first update
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+_startup_ts_str = time.strftime(TIMESTAMP_FORMAT)
+
+# (last_update, leaderboard rows) published as one immutable tuple; writers
+# rebind it, readers unpack it without locking
+_snapshot = (None, ())
 alerts = []
-update_lock = threading.Lock()
 scraper = None  # Global scraper instance
-event_loop = None  # Global event loop
+update_task = None  # Background leaderboard update task
 
-def initialize_scraper():
-    """Initialize the scraper in a new event loop"""
-    global scraper, event_loop
+# Seconds between leaderboard refreshes
+UPDATE_INTERVAL = 300
+
+# Database leaderboard rows and the monotonic time they were loaded (0 = stale)
+_leaderboard_cache = {'t': 0, 'v': []}
+
+# Serialized /api/leaderboard payload and its ETag, rebuilt once per update
+_cached_api_bytes = None
+_cached_etag = ''
+
+async def initialize_scraper():
+    """Initialize the scraper on the running event loop"""
+    global scraper
     try:
-        # Create new event loop if needed
-        if not event_loop or event_loop.is_closed():
-            event_loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(event_loop)
-        
         # Initialize scraper
-        scraper = event_loop.run_until_complete(TwitterScraper.create())
+        scraper = await TwitterScraper.create()
         
         if not scraper:
             raise Exception("Scraper initialization returned None")
@@ -93,23 +123,18 @@ def initialize_scraper():
         
     except Exception as e:
         logger.error(f"Error initializing scraper: {str(e)}")
-        if event_loop and not event_loop.is_closed():
-            try:
-                # Clean up any pending tasks
-                pending = asyncio.all_tasks(event_loop)
-                event_loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
-            except Exception as cleanup_error:
-                logger.error(f"Error cleaning up tasks: {str(cleanup_error)}")
-            finally:
-                event_loop.close()
-                event_loop = None
+        scraper = None
         return False
 
 async def update_leaderboard():
     """Update leaderboard data periodically"""
-    global current_leaderboard, last_update, alerts
+    global _snapshot, alerts
     
     try:
+        # Updates start every UPDATE_INTERVAL seconds however long each takes;
+        # one that overruns is followed immediately by the next
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
         while True:
             logger.info("Starting leaderboard update...")
             
@@ -117,48 +142,104 @@ async def update_leaderboard():
                 # Get list of tokens/usernames to track
                 tokens = await scraper.get_tracked_tokens()
                 
-                # Get Twitter data
-                twitter_data = await scraper.get_twitter_data(tokens)
-                
-                # Get market data
-                market_data = await scraper.get_market_data(tokens)
+                # Get Twitter and market data concurrently
+                twitter_task = asyncio.create_task(scraper.get_twitter_data(tokens))
+                market_task = asyncio.create_task(scraper.get_market_data(tokens))
+                twitter_data, market_data = await asyncio.gather(twitter_task, market_task)
                 
                 # Process the data
                 if twitter_data and market_data:
-                    with update_lock:
-                        current_leaderboard = process_leaderboard_data(twitter_data, market_data)
-                        last_update = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                        
-                        # Save data to database instead of JSON file
-                        for entry in current_leaderboard:
-                            save_twitter_stats(entry)
+                    leaderboard = process_leaderboard_data(twitter_data, market_data)
+                    last_update = time.strftime(TIMESTAMP_FORMAT)
+                    _snapshot = (last_update, tuple(leaderboard))
+                    set_api_cache(last_update, leaderboard)
+                    
+                    # Save data to database instead of JSON file
+                    await run_in_threadpool(save_twitter_stats_bulk, leaderboard)
+                    _leaderboard_cache['t'] = 0  # Force a reload on next read
                 
-                # Sleep for 5 minutes (300 seconds)
-                await asyncio.sleep(300)
+                # Sleep until 5 minutes (300 seconds) after this update started
+                deadline = max(deadline + UPDATE_INTERVAL, loop.time())
+                await asyncio.sleep(deadline - loop.time())
                 
             except Exception as e:
                 logger.error(f"Error updating leaderboard: {str(e)}")
                 await asyncio.sleep(60)  # Wait a minute before retrying
+                deadline = loop.time()
                 
     except asyncio.CancelledError:
         logger.info("Update task cancelled")
 
+async def get_leaderboard_cached(ttl=UPDATE_INTERVAL):
+    """Get the latest leaderboard from the database, at most once per ttl seconds"""
+    now = time.monotonic()
+    if not _leaderboard_cache['t'] or now - _leaderboard_cache['t'] > ttl:
+        leaderboard_data = await run_in_threadpool(get_latest_leaderboard)
+        
+        # Sort by Twitter score (descending)
+        leaderboard_data.sort(key=lambda x: x.get('twitter_score', 0), reverse=True)
+        
+        _leaderboard_cache['v'] = leaderboard_data
+        _leaderboard_cache['t'] = now
+    return _leaderboard_cache['v']
+
+def set_api_cache(timestamp, data):
+    """Serialize the leaderboard API payload once and cache it with its ETag"""
+    global _cached_api_bytes, _cached_etag
+    payload = orjson.dumps({'timestamp': timestamp, 'data': data})
+    _cached_api_bytes = payload
+    _cached_etag = f'"{hashlib.blake2b(payload, digest_size=8).hexdigest()}"'
+
 def process_leaderboard_data(twitter_data, market_data):
     """Process and combine Twitter and market data for the leaderboard"""
-    leaderboard = []
+    usernames = list(twitter_data)
+    count = len(usernames)
+    if not count:
+        return []
     
-    for username, data in twitter_data.items():
-        # Get market info for this token
-        market_info = market_data.get(username, {})
+    profiles = list(twitter_data.values())
+    growth = [data.get('growth_metrics') or EMPTY for data in profiles]
+    
+    def column(rows, key):
+        return np.fromiter((row.get(key, 0) for row in rows), dtype=np.float64, count=count)
+    
+    # Score and classify all rows column-wise, one array per field
+    growth_1h = column(growth, 'change_1h')
+    statuses = determine_growth_statuses(
+        column(growth, 'change_5m'),
+        column(growth, 'change_15m'),
+        column(growth, 'change_30m'),
+        growth_1h
+    ).tolist()
+    scores = calculate_twitter_scores(
+        column(profiles, 'followers_count'),
+        column(profiles, 'engagement_rate'),
+        growth_1h,
+        column(growth, 'change_24h'),
+        np.fromiter((bool(data.get('verified', False)) for data in profiles), dtype=np.bool_, count=count)
+    )
+    score_values = scores.tolist()
+    created_at = time.strftime('%Y-%m-%d')
+    
+    # Build row dicts once, already sorted by Twitter score (descending,
+    # ties keep insertion order)
+    leaderboard = []
+    for i in np.argsort(-scores, kind='stable').tolist():
+        username = usernames[i]
+        data = profiles[i]
+        growth_metrics = growth[i]
         
-        # Calculate growth metrics
-        growth_metrics = data.get('growth_metrics', {})
+        # Get market info for this token
+        market_info = market_data.get(username) or EMPTY
+        followers_count = data.get('followers_count', 0)
+        growth_1h_value = growth_metrics.get('change_1h', 0)
+        status = statuses[i]
         
         entry = {
             'username': username,
             'bio': data.get('bio', ''),
             'verified': data.get('verified', False),
-            'followers_count': data.get('followers_count', 0),
+            'followers_count': followers_count,
             'following_count': data.get('following_count', 0),
             'tweets_count': data.get('tweets_count', 0),
             'location': data.get('location', ''),
@@ -168,54 +249,40 @@ def process_leaderboard_data(twitter_data, market_data):
             'growth_5m': growth_metrics.get('change_5m', 0),
             'growth_15m': growth_metrics.get('change_15m', 0),
             'growth_30m': growth_metrics.get('change_30m', 0),
-            'growth_1h': growth_metrics.get('change_1h', 0),
+            'growth_1h': growth_1h_value,
             'growth_4h': growth_metrics.get('change_4h', 0),
             'growth_6h': growth_metrics.get('change_6h', 0),
             'growth_12h': growth_metrics.get('change_12h', 0),
             'growth_18h': growth_metrics.get('change_18h', 0),
             'growth_24h': growth_metrics.get('change_24h', 0),
-            'growth_status': determine_growth_status(growth_metrics),
+            'growth_status': status,
             'engagement_rate': data.get('engagement_rate', 0),
             'engagement_details': data.get('engagement_details', {}),
-            'created_at': datetime.now().strftime('%Y-%m-%d'),
-            'twitter_score': calculate_twitter_score(
-                data.get('followers_count', 0),
-                data.get('engagement_rate', 0),
-                growth_metrics.get('change_1h', 0),
-                growth_metrics.get('change_24h', 0),
-                data.get('verified', False)
-            )
+            'created_at': created_at,
+            'twitter_score': score_values[i],
+            'hourly_rate': growth_1h_value,
+            'followers_fmt': format_number(followers_count),
+            'is_spiking': status == SPIKING_STATUS
         }
         leaderboard.append(entry)
     
-    # Sort by Twitter score (descending)
-    leaderboard.sort(key=lambda x: x['twitter_score'], reverse=True)
     return leaderboard
 
-def determine_growth_status(growth_metrics):
-    """Determine the growth status based on various metrics"""
-    growth_5m = growth_metrics.get('change_5m', 0)
-    growth_15m = growth_metrics.get('change_15m', 0)
-    growth_30m = growth_metrics.get('change_30m', 0)
-    growth_1h = growth_metrics.get('change_1h', 0)
-    
-    # Check for spike (rapid growth in short term)
-    if growth_5m >= 2 or growth_15m >= 5 or growth_30m >= 8 or growth_1h >= 10:
-        return '🚀 Spiking'
-    
-    # Check for fast growth
-    if growth_1h >= 5:
-        return '📈 Fast Growth'
+def determine_growth_statuses(growth_5m, growth_15m, growth_30m, growth_1h):
+    """Determine the growth status of each row from NumPy arrays of equal length
     
-    # Check for steady growth
-    if growth_1h > 0:
-        return '↗️ Growing'
+    A row is spiking on rapid short-term growth, otherwise it is rated by
+    its 1h growth: fast growth, growing, declining or stable.
+    """
+    spiking = (growth_5m >= 2) | (growth_15m >= 5) | (growth_30m >= 8) | (growth_1h >= 10)
     
-    # Check for decline
-    if growth_1h < 0:
-        return '↘️ Declining'
-    
-    return '➡️ Stable'
+    # Conditions are checked in priority order, first match wins
+    index = np.select(
+        [spiking, growth_1h >= 5, growth_1h > 0, growth_1h < 0],
+        [0, 1, 2, 3],
+        default=4
+    )
+    return GROWTH_STATUSES[index]
 
 def calculate_engagement_rate(followers, likes, retweets):
     """Calculate engagement rate based on followers, likes, and retweets"""
@@ -223,139 +290,173 @@ def calculate_engagement_rate(followers, likes, retweets):
         return 0
     return (likes + retweets) / followers
 
-def calculate_twitter_score(followers, engagement_rate, growth_1h, growth_24h, verified):
-    """Calculate Twitter score based on various metrics"""
+def calculate_twitter_scores(followers, engagement_rate, growth_1h, growth_24h, verified):
+    """Calculate the Twitter score of each row from NumPy arrays of equal length"""
     # Base score from followers (logarithmic scale)
-    base_score = math.log10(max(followers, 1)) * 10
+    base_score = np.log10(np.maximum(followers, 1)) * 10
     
     # Engagement multiplier (0.5 to 1.5)
-    engagement_multiplier = 1 + (engagement_rate * 100)
-    engagement_multiplier = max(0.5, min(1.5, engagement_multiplier))
+    engagement_multiplier = np.clip(1 + (engagement_rate * 100), 0.5, 1.5)
     
     # Growth multiplier (1.0 to 2.0)
-    growth_multiplier = 1 + (max(growth_1h, 0) / 100) + (max(growth_24h, 0) / 200)
-    growth_multiplier = max(1.0, min(2.0, growth_multiplier))
+    growth_multiplier = np.clip(
+        1 + (np.maximum(growth_1h, 0) / 100) + (np.maximum(growth_24h, 0) / 200),
+        1.0, 2.0
+    )
     
     # Verification bonus
-    verified_bonus = 1.2 if verified else 1.0
+    verified_bonus = np.where(verified, 1.2, 1.0)
+    
+    # Calculate final scores
+    scores = base_score * engagement_multiplier * growth_multiplier * verified_bonus
+    return np.round(scores, 1)
+
+async def start_background_tasks():
+    """Start background tasks"""
+    global update_task
     
-    # Calculate final score
-    score = base_score * engagement_multiplier * growth_multiplier * verified_bonus
-    return round(score, 1)
+    # Create the database schema before anything reads or writes it
+    await run_in_threadpool(init_db)
+    
+    # Import existing JSON data into the database
+    await run_in_threadpool(import_existing_json_data)
+    
+    # Clean up old JSON files after importing
+    await run_in_threadpool(cleanup_json_files, keep_current=True)
+    
+    # Compile the page template now so the first request doesn't pay for it
+    templates.get_template('index.html')
+    
+    # Initialize scraper
+    if await initialize_scraper():
+        # Schedule the update loop on the server's event loop
+        update_task = asyncio.create_task(update_leaderboard())
+    else:
+        logger.error("Failed to initialize scraper, background tasks not started")
 
-def run_async_update():
-    """Run the async update task in the background"""
-    global event_loop
+@asynccontextmanager
+async def lifespan(app):
+    """Run background tasks for the lifetime of the server"""
+    loop = asyncio.get_running_loop()
+    logger.info(f"Running on event loop {type(loop).__module__}.{type(loop).__name__}")
+    await start_background_tasks()
     try:
-        # Use existing event loop or create new one
-        if not event_loop:
-            event_loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(event_loop)
-        
-        # Create and run update task
-        update_task = event_loop.create_task(update_leaderboard())
-        event_loop.run_forever()
-    except Exception as e:
-        logger.error(f"Error in async update: {str(e)}")
+        yield
     finally:
-        if event_loop and not event_loop.is_closed():
-            event_loop.close()
+        if update_task:
+            update_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await update_task
+        if scraper:
+            await scraper.close()
+
+# Initialize FastAPI app
+app = FastAPI(lifespan=lifespan, debug=DEBUG, default_response_class=ORJSONResponse)
+app.add_middleware(CORSMiddleware, allow_origins=['*'], allow_methods=['*'], allow_headers=['*'])
+app.mount('/static', StaticFiles(directory=str(STATIC_DIR)), name='static')
+
+templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
+templates.env.filters['format_number'] = format_number
+templates.env.bytecode_cache = FileSystemBytecodeCache(directory=str(JINJA_CACHE_DIR))
+templates.env.auto_reload = DEBUG
 
-@app.route('/')
-def index():
+@app.get('/', response_class=HTMLResponse)
+async def index(request: Request):
     """Render the main leaderboard page"""
     try:
-        # Get leaderboard data from database
-        leaderboard_data = get_latest_leaderboard()
+        # Snapshot the in-memory leaderboard
+        timestamp, snapshot = _snapshot
         
-        # If no data in database, use current_leaderboard
-        if not leaderboard_data and current_leaderboard:
-            leaderboard_data = current_leaderboard
+        # Get leaderboard data from database
+        leaderboard_data = await get_leaderboard_cached()
         
-        # Sort by Twitter score (descending)
-        leaderboard_data.sort(key=lambda x: x.get('twitter_score', 0), reverse=True)
+        # If no data in database, use the snapshot (already sorted by score)
+        if not leaderboard_data:
+            leaderboard_data = snapshot
         
         # Get timestamp
-        timestamp = last_update or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = timestamp or _startup_ts_str
         
         # Render template with data
-        return render_template(
+        return templates.TemplateResponse(
+            request,
             'index.html',
-            leaderboard=leaderboard_data,
-            last_update=timestamp,
-            alerts=alerts
+            {
+                'leaderboard': leaderboard_data,
+                'last_update': timestamp,
+                'alerts': alerts
+            }
         )
     except Exception as e:
         logger.error(f"Error rendering index: {str(e)}")
-        return render_template(
+        return templates.TemplateResponse(
+            request,
             'index.html',
-            leaderboard=[],
-            last_update=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            alerts=[f"Error loading data: {str(e)}"]
+            {
+                'leaderboard': [],
+                'last_update': time.strftime(TIMESTAMP_FORMAT),
+                'alerts': [f"Error loading data: {str(e)}"]
+            }
         )
 
-@app.route('/api/leaderboard')
-def get_leaderboard():
+@app.get('/api/leaderboard')
+async def get_leaderboard(request: Request):
     """API endpoint to get leaderboard data"""
     try:
-        # Get leaderboard data from database
-        leaderboard_data = get_latest_leaderboard()
-        
-        # If no data in database, use current_leaderboard
-        if not leaderboard_data and current_leaderboard:
-            leaderboard_data = current_leaderboard
+        # Populate the cache from the database until the first update lands
+        if _cached_api_bytes is None:
+            timestamp, snapshot = _snapshot
+            leaderboard_data = await get_leaderboard_cached()
             
-        return jsonify({
-            'timestamp': last_update or datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'data': leaderboard_data
-        })
+            # If no data in database, use the in-memory snapshot
+            if not leaderboard_data and snapshot:
+                leaderboard_data = snapshot
+            
+            # update_leaderboard may have published fresher data while the
+            # database was read; never overwrite it with this older view
+            if _cached_api_bytes is None:
+                set_api_cache(
+                    timestamp or _startup_ts_str,
+                    leaderboard_data
+                )
+        
+        if request.headers.get('if-none-match') == _cached_etag:
+            return Response(status_code=304, headers={'ETag': _cached_etag})
+        
+        return Response(
+            _cached_api_bytes,
+            media_type='application/json',
+            headers={'ETag': _cached_etag, 'Cache-Control': 'public, max-age=30'}
+        )
     except Exception as e:
         logger.error(f"Error in API: {str(e)}")
-        return jsonify({
+        return ORJSONResponse({
             'error': str(e),
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'timestamp': time.strftime(TIMESTAMP_FORMAT),
             'data': []
-        }), 500
+        }, status_code=500)
 
-@app.route('/api/history/<username>')
-def get_user_history(username):
+@app.get('/api/history/{username}')
+async def get_user_history(username: str):
     """API endpoint to get historical data for a specific user"""
     try:
         # Get historical data from database
-        history_data = get_historical_data(username)
+        history_data = await run_in_threadpool(get_historical_data, username)
         
-        return jsonify({
+        return ORJSONResponse({
             'username': username,
             'history': history_data
         })
     except Exception as e:
         logger.error(f"Error getting history for {username}: {str(e)}")
-        return jsonify({
+        return ORJSONResponse({
             'error': str(e),
             'username': username,
             'history': []
-        }), 500
-
-def start_background_tasks():
-    """Start background tasks"""
-    # Import existing JSON data into the database
-    import_existing_json_data()
-    
-    # Clean up old JSON files after importing
-    cleanup_json_files(keep_current=True)
-    
-    # Initialize scraper
-    if initialize_scraper():
-        # Start update thread
-        update_thread = threading.Thread(target=run_async_update)
-        update_thread.daemon = True
-        update_thread.start()
-    else:
-        logger.error("Failed to initialize scraper, background tasks not started")
+        }, status_code=500)
 
 if __name__ == '__main__':
-    # Start background tasks
-    start_background_tasks()
-    
-    # Run Flask app
-    app.run(host='0.0.0.0', port=5000)
\ No newline at end of file
+    # Run the ASGI app; background tasks start from the lifespan handler
+    # uvloop is not available on Windows
+    loop = 'asyncio' if sys.platform == 'win32' else 'uvloop'
+    uvicorn.run(app, host='0.0.0.0', port=5000, loop=loop)
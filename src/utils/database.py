@@ -1,8 +1,13 @@
 import sqlite3
+import codecs
 import os
 import json
+import orjson
 import logging
-from datetime import datetime
+import threading
+import atexit
+import time
+from itertools import chain
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -17,11 +22,167 @@ def ensure_db_directory():
     if not os.path.exists(db_dir):
         os.makedirs(db_dir)
 
+# Per-connection tuning: WAL lets readers proceed during writes, NORMAL sync is
+# durable under WAL without an fsync per commit, and the page cache / mmap are
+# sized so the working set stays in memory
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Formats for metric timestamps and user created_at dates
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+DATE_FORMAT = '%Y-%m-%d'
+
+# Entries written per transaction during JSON import
+IMPORT_CHUNK_SIZE = 5000
+
+# Multi-row INSERTs stay under 999 bound parameters, the lowest default
+# SQLITE_MAX_VARIABLE_NUMBER across SQLite builds
+_SQLITE_MAX_VARIABLES = 999
+_MAX_ROWS_PER_INSERT = 500
+
+# Write-path statements, defined once so every call hands sqlite3 the same
+# text and hits its per-connection statement cache
+_SQL_SELECT_USER_ID = "SELECT id FROM users WHERE username = ?"
+_SQL_INSERT_USERNAME = "INSERT INTO users (username) VALUES (?) ON CONFLICT(username) DO NOTHING RETURNING id"
+_SQL_USER_COLUMNS = "INSERT INTO users (username, bio, location, verified, created_at)"
+_SQL_USER_CONFLICT = """ON CONFLICT(username) DO UPDATE SET
+    bio = excluded.bio, location = excluded.location,
+    verified = excluded.verified, created_at = excluded.created_at"""
+_SQL_UPSERT_USER = f"{_SQL_USER_COLUMNS} VALUES (?, ?, ?, ?, ?) {_SQL_USER_CONFLICT} RETURNING id"
+_SQL_INSERT_METRIC = """
+    INSERT INTO metrics 
+    (user_id, timestamp, followers_count, following_count, tweets_count, 
+     engagement_rate, twitter_score)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+_SQL_INSERT_ENGAGEMENT = "INSERT INTO engagement_details (metric_id, total_engagement, tweets_analyzed) VALUES (?, ?, ?)"
+
+# Get the latest metrics for each user in one pass. The follower
+# change is measured against the nearest earlier timestamp (the GROUPS
+# frame skips rows sharing the current timestamp), and engagement
+# details are joined in directly.
+_SQL_LATEST_LEADERBOARD = """
+WITH RankedMetrics AS (
+    SELECT 
+        m.*,
+        u.username,
+        u.bio,
+        u.location,
+        u.verified,
+        ROW_NUMBER() OVER (PARTITION BY m.user_id ORDER BY m.timestamp DESC) as rn,
+        LAST_VALUE(m.followers_count) OVER (
+            PARTITION BY m.user_id ORDER BY m.timestamp
+            GROUPS BETWEEN 1 PRECEDING AND 1 PRECEDING
+        ) as prev_followers
+    FROM metrics m
+    JOIN users u ON m.user_id = u.id
+)
+SELECT
+    r.username,
+    r.followers_count,
+    r.following_count,
+    r.tweets_count,
+    r.followers_count - COALESCE(r.prev_followers, r.followers_count) as follower_change,
+    r.bio,
+    r.location,
+    r.verified,
+    r.engagement_rate,
+    ed.total_engagement,
+    ed.tweets_analyzed,
+    r.twitter_score
+FROM RankedMetrics r
+LEFT JOIN engagement_details ed ON ed.metric_id = r.id
+WHERE r.rn = 1
+ORDER BY r.followers_count DESC
+"""
+
+# Numeric metric and engagement columns in INSERT order, with their types and
+# defaults
+_METRIC_FIELDS = (
+    ('followers_count', int, 0),
+    ('following_count', int, 0),
+    ('tweets_count', int, 0),
+    ('engagement_rate', float, 0.0),
+    ('twitter_score', int, 0),
+)
+_ENGAGEMENT_FIELDS = (
+    ('total_engagement', float, 0.0),
+    ('tweets_analyzed', int, 0),
+)
+
+# Default values for fields that might be expected by the template
+_LEADERBOARD_DEFAULTS = {
+    'price': 0.0,
+    'price_change_24h': 0.0,
+    'market_cap': 0,
+    'growth_5m': 0.0,
+    'growth_15m': 0.0,
+    'growth_30m': 0.0,
+    'growth_1h': 0.0,
+    'growth_4h': 0.0,
+    'growth_6h': 0.0,
+    'growth_12h': 0.0,
+    'growth_18h': 0.0,
+    'growth_24h': 0.0,
+    'growth_status': '➡️ Stable'
+}
+
+# Statements kept prepared per connection (sqlite3 defaults to 128)
+_CACHED_STATEMENTS = 256
+
+# One long-lived connection per thread, plus a registry so they can be closed
+# at exit
+_conn_local = threading.local()
+_open_conns = []
+_open_conns_lock = threading.Lock()
+
+def _connect():
+    """Open a database connection with the tuned PRAGMAs applied"""
+    # Connections never leave the thread that created them; disabling the
+    # check only lets _close_all() close them from the exit handler
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, cached_statements=_CACHED_STATEMENTS)
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+def _get_conn():
+    """Get this thread's shared connection, opening it on first use"""
+    conn = getattr(_conn_local, 'conn', None)
+    if conn is None:
+        conn = _connect()
+        _conn_local.conn = conn
+        with _open_conns_lock:
+            _open_conns.append(conn)
+    return conn
+
+def _close_all():
+    """Close every shared connection, refreshing planner statistics first"""
+    with _open_conns_lock:
+        while _open_conns:
+            try:
+                conn = _open_conns.pop()
+                conn.execute("PRAGMA optimize")
+                conn.close()
+            except Exception as e:
+                logger.error(f"Error closing database connection: {str(e)}")
+
+atexit.register(_close_all)
+
 def init_db():
     """Initialize the database with required tables"""
     ensure_db_directory()
     
     conn = sqlite3.connect(DB_PATH)
+    
+    # page_size only takes effect on a fresh database, before WAL is enabled
+    conn.execute("PRAGMA page_size=8192")
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
     cursor = conn.cursor()
     
     # Create users table
@@ -62,232 +223,334 @@ def init_db():
     )
     ''')
     
+    # Indexes for the per-user time-series scans and engagement lookups
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_metrics_user_ts ON metrics (user_id, timestamp DESC)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_engagement_metric ON engagement_details (metric_id)")
+    
     conn.commit()
+    
+    # Gather planner statistics once; PRAGMA optimize keeps them fresh on close
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+    if cursor.fetchone() is None:
+        cursor.execute("ANALYZE")
+    
     conn.close()
     
     logger.info("Database initialized successfully")
 
 def get_user_id(username):
     """Get user ID from username, create if not exists"""
-    conn = sqlite3.connect(DB_PATH)
+    conn = _get_conn()
     cursor = conn.cursor()
     
-    cursor.execute("SELECT id FROM users WHERE username = ?", (username,))
+    # Insert first; RETURNING yields no row when the user already exists
+    cursor.execute(_SQL_INSERT_USERNAME, (username,))
     result = cursor.fetchone()
     
-    if result:
-        user_id = result[0]
-    else:
-        cursor.execute("INSERT INTO users (username) VALUES (?)", (username,))
-        user_id = cursor.lastrowid
+    if result is None:
+        cursor.execute(_SQL_SELECT_USER_ID, (username,))
+        result = cursor.fetchone()
+    user_id = result[0]
     
     conn.commit()
-    conn.close()
     
     return user_id
 
-def save_twitter_stats(stats):
-    """Save Twitter stats to the database"""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
+def _coerce_fields(source, fields):
+    """Read typed column values from a stats dict, in column order
     
-    try:
-        # Validate input
-        if not isinstance(stats, dict):
-            raise ValueError(f"Expected dictionary, got {type(stats)}")
-            
-        # Check for required username field
-        if 'username' not in stats or not stats['username']:
-            raise ValueError("Missing required field: username")
-            
-        username = stats['username']
-        
-        # Get or create user
-        cursor.execute(
-            "SELECT id FROM users WHERE username = ?", 
-            (username,)
-        )
-        result = cursor.fetchone()
+    Values already of the column type are passed through without conversion.
+    """
+    values = []
+    for key, kind, default in fields:
+        value = source.get(key, default)
+        values.append(value if type(value) is kind else kind(value))
+    return tuple(values)
+
+def _insert_twitter_stats(cursor, stats):
+    """Insert one stats entry using an open cursor, without committing"""
+    # Validate input
+    if not isinstance(stats, dict):
+        raise ValueError(f"Expected dictionary, got {type(stats)}")
         
-        if result:
-            user_id = result[0]
-            # Update user info
-            cursor.execute(
-                "UPDATE users SET bio = ?, location = ?, verified = ?, created_at = ? WHERE id = ?",
-                (
-                    stats.get('bio', ''),
-                    stats.get('location', ''),
-                    stats.get('verified', False),
-                    stats.get('created_at', datetime.now().strftime('%Y-%m-%d')),
-                    user_id
-                )
-            )
-        else:
-            # Create new user
-            cursor.execute(
-                "INSERT INTO users (username, bio, location, verified, created_at) VALUES (?, ?, ?, ?, ?)",
-                (
-                    username,
-                    stats.get('bio', ''),
-                    stats.get('location', ''),
-                    stats.get('verified', False),
-                    stats.get('created_at', datetime.now().strftime('%Y-%m-%d'))
-                )
-            )
-            user_id = cursor.lastrowid
+    # Check for required username field
+    if 'username' not in stats or not stats['username']:
+        raise ValueError("Missing required field: username")
         
-        # Insert metrics
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    username = stats['username']
+    
+    # One clock read covers the metric timestamp and the created_at default
+    now = time.localtime()
+    timestamp = time.strftime(TIMESTAMP_FORMAT, now)
+    created_at = stats['created_at'] if 'created_at' in stats else time.strftime(DATE_FORMAT, now)
+    
+    # Create or update the user in one statement
+    cursor.execute(
+        _SQL_UPSERT_USER,
+        (
+            username,
+            stats.get('bio', ''),
+            stats.get('location', ''),
+            stats.get('verified', False),
+            created_at
+        )
+    )
+    user_id = cursor.fetchone()[0]
+    
+    # Insert metrics
+    cursor.execute(
+        _SQL_INSERT_METRIC,
+        (
+            user_id,
+            timestamp,
+            *_coerce_fields(stats, _METRIC_FIELDS)
+        )
+    )
+    metric_id = cursor.lastrowid
+    
+    # Insert engagement details if available
+    if 'engagement_details' in stats and isinstance(stats['engagement_details'], dict):
+        engagement_details = stats['engagement_details']
         cursor.execute(
-            """
-            INSERT INTO metrics 
-            (user_id, timestamp, followers_count, following_count, tweets_count, 
-             engagement_rate, twitter_score)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                user_id,
-                timestamp,
-                int(stats.get('followers_count', 0)),
-                int(stats.get('following_count', 0)),
-                int(stats.get('tweets_count', 0)),
-                float(stats.get('engagement_rate', 0.0)),
-                int(stats.get('twitter_score', 0))
-            )
+            _SQL_INSERT_ENGAGEMENT,
+            (metric_id, *_coerce_fields(engagement_details, _ENGAGEMENT_FIELDS))
         )
-        metric_id = cursor.lastrowid
+
+def save_twitter_stats(stats, conn=None):
+    """Save Twitter stats to the database
+    
+    Args:
+        stats (dict): Stats entry to save
+        conn (sqlite3.Connection): Optional connection whose transaction is owned
+            by the caller. The entry is written inside it and left uncommitted.
+    """
+    own_transaction = conn is None
+    if own_transaction:
+        conn = _get_conn()
+    elif not conn.in_transaction:
+        conn.execute("BEGIN")
+    cursor = conn.cursor()
+    
+    try:
+        if not own_transaction:
+            # Isolate this entry so a failure only discards its own rows
+            cursor.execute("SAVEPOINT save_twitter_stats")
         
-        # Insert engagement details if available
-        if 'engagement_details' in stats and isinstance(stats['engagement_details'], dict):
-            engagement_details = stats['engagement_details']
-            cursor.execute(
-                "INSERT INTO engagement_details (metric_id, total_engagement, tweets_analyzed) VALUES (?, ?, ?)",
-                (
-                    metric_id,
-                    float(engagement_details.get('total_engagement', 0.0)),
-                    int(engagement_details.get('tweets_analyzed', 0))
-                )
-            )
+        _insert_twitter_stats(cursor, stats)
         
-        conn.commit()
-        logger.info(f"Successfully saved stats for {username} to database")
+        if own_transaction:
+            conn.commit()
+        else:
+            cursor.execute("RELEASE save_twitter_stats")
+        logger.info(f"Successfully saved stats for {stats['username']} to database")
         return True
     
     except Exception as e:
-        conn.rollback()
-        logger.error(f"Error saving stats to database for {stats.get('username', 'unknown')}: {str(e)}")
+        if own_transaction:
+            conn.rollback()
+        else:
+            cursor.execute("ROLLBACK TO save_twitter_stats")
+            cursor.execute("RELEASE save_twitter_stats")
+        username = stats.get('username', 'unknown') if isinstance(stats, dict) else 'unknown'
+        logger.error(f"Error saving stats to database for {username}: {str(e)}")
         return False
+
+def _insert_values(cursor, head, rows, tail=''):
+    """Execute head + multi-row VALUES + tail over rows in parameter-limited chunks
+    
+    Returns:
+        list: Rowids of the inserted rows in order. Only meaningful for plain
+            INSERTs, where SQLite assigns a statement's rowids consecutively.
+    """
+    width = len(rows[0])
+    size = min(_MAX_ROWS_PER_INSERT, _SQLITE_MAX_VARIABLES // width)
+    placeholder = '(' + ', '.join('?' * width) + ')'
+    rowids = []
+    
+    for start in range(0, len(rows), size):
+        chunk = rows[start:start + size]
+        cursor.execute(
+            f"{head} VALUES {', '.join([placeholder] * len(chunk))} {tail}",
+            list(chain.from_iterable(chunk))
+        )
+        last = cursor.lastrowid
+        rowids.extend(range(last - len(chunk) + 1, last + 1))
     
-    finally:
-        conn.close()
+    return rowids
 
-def get_latest_leaderboard():
-    """Get the latest leaderboard data from the database"""
-    conn = None
-    try:
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row  # This enables column access by name
-        cursor = conn.cursor()
+def _insert_twitter_stats_bulk(cursor, stats_list):
+    """Insert a batch of stats entries using an open cursor, without committing
+    
+    Returns:
+        int: Number of entries inserted
+    """
+    now = time.localtime()
+    timestamp = time.strftime(TIMESTAMP_FORMAT, now)
+    today = time.strftime(DATE_FORMAT, now)
+    users = {}
+    entries = []
+    
+    # Validate and convert everything up front so a bad entry is skipped
+    # before any SQL runs
+    for stats in stats_list:
+        try:
+            if not isinstance(stats, dict):
+                raise ValueError(f"Expected dictionary, got {type(stats)}")
+            if 'username' not in stats or not stats['username']:
+                raise ValueError("Missing required field: username")
+            
+            username = stats['username']
+            metric = (timestamp, *_coerce_fields(stats, _METRIC_FIELDS))
+            engagement = None
+            if 'engagement_details' in stats and isinstance(stats['engagement_details'], dict):
+                engagement = _coerce_fields(stats['engagement_details'], _ENGAGEMENT_FIELDS)
+        except (TypeError, ValueError) as e:
+            # Skip malformed entries without aborting the batch
+            logger.error(f"Skipping invalid stats entry: {str(e)}")
+            continue
         
-        # Get the latest metrics for each user
-        query = """
-        WITH RankedMetrics AS (
-            SELECT 
-                m.*,
-                u.username,
-                u.bio,
-                u.location,
-                u.verified,
-                ROW_NUMBER() OVER (PARTITION BY m.user_id ORDER BY m.timestamp DESC) as rn
-            FROM metrics m
-            JOIN users u ON m.user_id = u.id
+        # The last entry for a username wins, as with sequential updates
+        users[username] = (
+            username,
+            stats.get('bio', ''),
+            stats.get('location', ''),
+            stats.get('verified', False),
+            stats.get('created_at', today)
+        )
+        entries.append((username, metric, engagement))
+    
+    if not entries:
+        return 0
+    
+    # Create or update every user, then resolve all their ids at once
+    _insert_values(cursor, _SQL_USER_COLUMNS, list(users.values()), _SQL_USER_CONFLICT)
+    user_ids = {}
+    usernames = list(users)
+    for start in range(0, len(usernames), _SQLITE_MAX_VARIABLES):
+        chunk = usernames[start:start + _SQLITE_MAX_VARIABLES]
+        cursor.execute(
+            f"SELECT id, username FROM users WHERE username IN ({', '.join('?' * len(chunk))})",
+            chunk
         )
-        SELECT * FROM RankedMetrics WHERE rn = 1
-        ORDER BY followers_count DESC
-        """
+        user_ids.update((username, user_id) for user_id, username in cursor.fetchall())
+    
+    metric_ids = _insert_values(
+        cursor,
+        """INSERT INTO metrics
+        (user_id, timestamp, followers_count, following_count, tweets_count,
+         engagement_rate, twitter_score)""",
+        [(user_ids[username],) + metric for username, metric, _ in entries]
+    )
+    
+    engagement_rows = [
+        (metric_id,) + engagement
+        for metric_id, (_, _, engagement) in zip(metric_ids, entries)
+        if engagement is not None
+    ]
+    if engagement_rows:
+        _insert_values(
+            cursor,
+            "INSERT INTO engagement_details (metric_id, total_engagement, tweets_analyzed)",
+            engagement_rows
+        )
+    
+    return len(entries)
+
+def save_twitter_stats_bulk(stats_list, conn=None):
+    """Save a batch of Twitter stats to the database in a single transaction
+    
+    Args:
+        stats_list (list): Stats dictionaries as accepted by save_twitter_stats
+        conn (sqlite3.Connection): Optional connection whose transaction is owned
+            by the caller. The batch is written inside it and left uncommitted.
         
-        cursor.execute(query)
-        results = cursor.fetchall()
+    Returns:
+        int: Number of entries saved (0 if the batch was rolled back)
+    """
+    own_transaction = conn is None
+    if own_transaction:
+        conn = _get_conn()
+    elif not conn.in_transaction:
+        conn.execute("BEGIN")
+    cursor = conn.cursor()
+    
+    try:
+        if not own_transaction:
+            cursor.execute("SAVEPOINT save_twitter_stats_bulk")
         
-        # Convert to list of dictionaries
-        leaderboard = []
-        for row in results:
+        saved = _insert_twitter_stats_bulk(cursor, stats_list)
+        
+        if own_transaction:
+            conn.commit()
+        else:
+            cursor.execute("RELEASE save_twitter_stats_bulk")
+        logger.info(f"Successfully saved stats for {saved} users to database")
+        return saved
+    
+    except Exception as e:
+        if own_transaction:
+            conn.rollback()
+        else:
+            cursor.execute("ROLLBACK TO save_twitter_stats_bulk")
+            cursor.execute("RELEASE save_twitter_stats_bulk")
+        logger.error(f"Error saving stats batch to database: {str(e)}")
+        return 0
+
+def iter_latest_leaderboard(chunk=256):
+    """Yield the latest leaderboard entries from the database
+    
+    Args:
+        chunk (int): Rows fetched from SQLite per round trip
+    """
+    cursor = _get_conn().cursor()
+    cursor.execute(_SQL_LATEST_LEADERBOARD)
+    
+    while True:
+        rows = cursor.fetchmany(chunk)
+        if not rows:
+            break
+        
+        # Unpack rows in SELECT order
+        for (username, followers_count, following_count, tweets_count, follower_change,
+             bio, location, verified, engagement_rate, total_engagement, tweets_analyzed,
+             twitter_score) in rows:
             try:
-                # Get previous metrics to calculate change
-                cursor.execute("""
-                    SELECT followers_count 
-                    FROM metrics 
-                    WHERE user_id = ? AND timestamp < ? 
-                    ORDER BY timestamp DESC 
-                    LIMIT 1
-                """, (row['user_id'], row['timestamp']))
-                
-                prev_result = cursor.fetchone()
-                prev_followers = prev_result['followers_count'] if prev_result else row['followers_count']
-                follower_change = row['followers_count'] - prev_followers
-                
-                # Get engagement details
-                cursor.execute("""
-                    SELECT total_engagement, tweets_analyzed 
-                    FROM engagement_details 
-                    WHERE metric_id = ?
-                """, (row['id'],))
-                
-                engagement_row = cursor.fetchone()
-                engagement_details = {
-                    'total_engagement': engagement_row['total_engagement'] if engagement_row else 0,
-                    'tweets_analyzed': engagement_row['tweets_analyzed'] if engagement_row else 0
-                }
-                
                 # Create entry with all required fields
                 entry = {
-                    'username': row['username'],
-                    'followers_count': row['followers_count'],
-                    'following_count': row['following_count'],
-                    'tweets_count': row['tweets_count'],
+                    'username': username,
+                    'followers_count': followers_count,
+                    'following_count': following_count,
+                    'tweets_count': tweets_count,
                     'follower_change': follower_change,
-                    'bio': row['bio'] or '',
-                    'location': row['location'] or '',
-                    'verified': bool(row['verified']),
-                    'engagement_rate': row['engagement_rate'],
-                    'engagement_details': engagement_details,
-                    'twitter_score': row['twitter_score'],
-                    # Add default values for fields that might be expected by the template
-                    'price': 0.0,
-                    'price_change_24h': 0.0,
-                    'market_cap': 0,
-                    'growth_5m': 0.0,
-                    'growth_15m': 0.0,
-                    'growth_30m': 0.0,
-                    'growth_1h': 0.0,
-                    'growth_4h': 0.0,
-                    'growth_6h': 0.0,
-                    'growth_12h': 0.0,
-                    'growth_18h': 0.0,
-                    'growth_24h': 0.0,
-                    'growth_status': '➡️ Stable'
+                    'bio': bio or '',
+                    'location': location or '',
+                    'verified': bool(verified),
+                    'engagement_rate': engagement_rate,
+                    'engagement_details': {
+                        'total_engagement': total_engagement or 0,
+                        'tweets_analyzed': tweets_analyzed or 0
+                    },
+                    'twitter_score': twitter_score,
+                    **_LEADERBOARD_DEFAULTS
                 }
-                
-                leaderboard.append(entry)
             except Exception as e:
-                logger.error(f"Error processing row for {row['username']}: {str(e)}")
+                logger.error(f"Error processing row for {username}: {str(e)}")
                 continue
-        
-        return leaderboard
+            
+            yield entry
+
+def get_latest_leaderboard():
+    """Get the latest leaderboard data from the database"""
+    try:
+        return list(iter_latest_leaderboard())
     except Exception as e:
         logger.error(f"Error getting leaderboard data: {str(e)}")
         return []
-    finally:
-        if conn:
-            conn.close()
 
 def get_historical_data(username, days=30):
     """Get historical follower data for a specific user"""
-    conn = None
     try:
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        cursor = _get_conn().cursor()
         
         cursor.execute("""
             SELECT u.id FROM users u WHERE u.username = ?
@@ -298,28 +561,27 @@ def get_historical_data(username, days=30):
             logger.warning(f"No user found with username: {username}")
             return []
         
-        user_id = user_row['id']
+        user_id = user_row[0]
         
-        # Get metrics for the specified time period
+        # Get the most recent 'days' entries straight off the index, then
+        # restore ascending order
         cursor.execute("""
             SELECT timestamp, followers_count
             FROM metrics
             WHERE user_id = ?
-            ORDER BY timestamp ASC
-        """, (user_id,))
+            ORDER BY timestamp DESC
+            LIMIT ?
+        """, (user_id, days))
         
         results = cursor.fetchall()
-        
-        # Limit to the most recent 'days' entries if there are more
-        if len(results) > days:
-            results = results[-days:]
+        results.reverse()
             
         history = []
-        for row in results:
+        for timestamp, followers_count in results:
             try:
                 history.append({
-                    'timestamp': row['timestamp'],
-                    'followers_count': row['followers_count']
+                    'timestamp': timestamp,
+                    'followers_count': followers_count
                 })
             except Exception as e:
                 logger.error(f"Error processing historical data row: {str(e)}")
@@ -329,9 +591,6 @@ def get_historical_data(username, days=30):
     except Exception as e:
         logger.error(f"Error getting historical data for {username}: {str(e)}")
         return []
-    finally:
-        if conn:
-            conn.close()
 
 def import_existing_json_data():
     """Import existing JSON data into the database"""
@@ -341,22 +600,32 @@ def import_existing_json_data():
     json_files = [f for f in os.listdir(data_dir) if f.endswith('.json')]
     imported_files = []
     
+    # Write each file as one multi-row batch on a shared connection,
+    # committing once IMPORT_CHUNK_SIZE entries are pending
+    conn = _get_conn()
+    pending = 0
+    today = time.strftime(DATE_FORMAT)
+    
     for json_file in json_files:
         file_path = os.path.join(data_dir, json_file)
         try:
-            # Try different encodings to handle potential encoding issues
-            encodings = ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252']
-            data = None
+            # Read the file once and parse the bytes directly, dropping a
+            # UTF-8 BOM if present
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+            if raw.startswith(codecs.BOM_UTF8):
+                raw = raw[len(codecs.BOM_UTF8):]
             
-            for encoding in encodings:
+            data = None
+            try:
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # Not valid UTF-8; latin-1 maps every byte, so it is the only
+                # fallback worth trying
                 try:
-                    with open(file_path, 'r', encoding=encoding) as f:
-                        data = json.load(f)
-                    break  # If successful, break the loop
-                except UnicodeDecodeError:
-                    continue  # Try the next encoding
+                    data = json.loads(raw.decode('latin-1'))
                 except json.JSONDecodeError:
-                    continue  # Try the next encoding
+                    pass
             
             if data is None:
                 logger.error(f"Failed to decode {json_file} with any encoding")
@@ -372,6 +641,7 @@ def import_existing_json_data():
                 stats_list = data['data']
             
             # Process each stat entry
+            file_stats = []
             for stats in stats_list:
                 # Validate required fields
                 if not isinstance(stats, dict):
@@ -391,7 +661,7 @@ def import_existing_json_data():
                     'tweets_count': stats.get('tweets_count', 0),
                     'engagement_rate': stats.get('engagement_rate', 0.0),
                     'twitter_score': stats.get('twitter_score', 0),
-                    'created_at': stats.get('created_at', datetime.now().strftime('%Y-%m-%d'))
+                    'created_at': stats.get('created_at', today)
                 }
                 
                 # Add engagement details if available
@@ -403,14 +673,26 @@ def import_existing_json_data():
                         'tweets_analyzed': 0
                     }
                 
-                # Save to database
-                save_twitter_stats(stats_copy)
+                file_stats.append(stats_copy)
+            
+            # Save to database
+            if file_stats:
+                pending += save_twitter_stats_bulk(file_stats, conn=conn)
+                if pending >= IMPORT_CHUNK_SIZE:
+                    conn.commit()
+                    pending = 0
             
             logger.info(f"Imported data from {json_file}")
             imported_files.append(file_path)
         except Exception as e:
             logger.error(f"Error importing data from {json_file}: {str(e)}")
     
+    try:
+        conn.commit()
+    except Exception as e:
+        conn.rollback()
+        logger.error(f"Error committing imported data: {str(e)}")
+    
     return imported_files
 
 def cleanup_json_files(keep_current=True):
@@ -445,6 +727,3 @@ def cleanup_json_files(keep_current=True):
             logger.error(f"Error deleting {json_file}: {str(e)}")
     
     return deleted_files
-
-# Initialize the database when the module is imported
-init_db() 
\ No newline at end of file
@@ -1,17 +1,25 @@
 from datetime import datetime, timedelta
 import time
+import sys
 import logging
 import re
 import os
 import random
 from dotenv import load_dotenv
-import json
 import math
+import numpy as np
 import asyncio
+import bisect
+from collections import deque
+from functools import lru_cache
+from contextlib import asynccontextmanager
+import sqlite3
+import orjson
 from playwright.async_api import async_playwright
 from tqdm import tqdm
 import aiohttp
 from pathlib import Path
+from urllib.parse import quote
 
 # Configure logging
 logging.basicConfig(
@@ -20,6 +28,220 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Characters kept when parsing counts like '1.5K', the suffix multipliers in
+# the order they are checked, and a table deleting every suffix letter
+_NUMBER_STRIP_RE = re.compile(r'[^\d.KMB]')
+_NUMBER_MULTIPLIERS = {'K': 1000, 'M': 1000000, 'B': 1000000000}
+_NUMBER_SUFFIXES = str.maketrans('', '', ''.join(_NUMBER_MULTIPLIERS))
+
+# Follower count on a Nitter-style profile page
+_MIRROR_FOLLOWERS_RE = re.compile(r'class="followers".*?class="profile-stat-num">([^<]+)<', re.S)
+
+# Twitter's static JS bundles, replayed from a recorded HAR
+_STATIC_ASSET_URLS = 'https://abs.twimg.com/**'
+
+# Map Twitter usernames to Binance trading pairs
+_BINANCE_SYMBOLS = {
+    'bitcoin': 'BTCUSDT',
+    'ethereum': 'ETHUSDT',
+    'binance': 'BNBUSDT',
+    'dogecoin': 'DOGEUSDT',
+    'cardano': 'ADAUSDT',
+    'solana': 'SOLUSDT',
+    'ripple': 'XRPUSDT',
+    'polkadot': 'DOTUSDT',
+    'avalanche': 'AVAXUSDT',
+    'chainlink': 'LINKUSDT'
+}
+_BINANCE_STREAM_URL = 'wss://stream.binance.com:9443/stream?streams='
+
+# Resource types never loaded by the scraping contexts
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font', 'stylesheet'})
+
+# Follower growth intervals in seconds
+_GROWTH_INTERVALS = {
+    'change_5m': 5 * 60,
+    'change_15m': 15 * 60,
+    'change_30m': 30 * 60,
+    'change_1h': 60 * 60,
+    'change_4h': 4 * 60 * 60,
+    'change_6h': 6 * 60 * 60,
+    'change_12h': 12 * 60 * 60,
+    'change_18h': 18 * 60 * 60,
+    'change_24h': 24 * 60 * 60
+}
+_GROWTH_INTERVAL_SECONDS = np.fromiter(_GROWTH_INTERVALS.values(), dtype=np.int64)
+
+def _twitter_scores(followers, engagement_rate, verified):
+    """
+    Calculate Twitter Scores similar to TwitterScore.io over NumPy arrays of equal length
+    Score is based on followers, engagement rate, and verification status
+    """
+    # Base score from followers (logarithmic scale); no followers scores 0
+    positive = followers > 0
+    follower_score = (1000 * (1 + np.log10(np.where(positive, followers, 1)))) / 7
+    
+    # Engagement multiplier (0.5 to 2.0)
+    engagement_multiplier = np.clip(1 + (engagement_rate * 100), 0.5, 2.0)  # Convert to percentage
+    
+    # Verification bonus
+    verification_bonus = np.where(verified, 1.2, 1.0)
+    
+    # Calculate final scores, normalized to a 0-1000 scale
+    scores = np.trunc(follower_score * engagement_multiplier * verification_bonus)
+    return np.where(positive, np.clip(scores, 0, 1000), 0).astype(np.int64)
+
+def _point_at_or_before(history, timestamps, cutoff):
+    """Return the latest history point at or before cutoff, or None
+    
+    history must be sorted by timestamp, with timestamps holding the
+    matching timestamp of each point.
+    """
+    idx = bisect.bisect_right(timestamps, cutoff) - 1
+    return history[idx] if idx >= 0 else None
+
+def _ticker_weight(symbol_count):
+    """Binance request weight of a /ticker/24hr call for this many symbols"""
+    if symbol_count <= 20:
+        return 2
+    if symbol_count <= 100:
+        return 40
+    return 80
+
+class AsyncThrottler:
+    """Keep request weight under a limit over a sliding time window
+    
+    Mirrors Binance's request weight limit, so bursts wait for capacity
+    instead of being rejected with 429/-1003 and backing off.
+    """
+    
+    def __init__(self, rate_limit=1200, interval=60):
+        self.rate_limit = rate_limit
+        self.interval = interval
+        self._spent = deque()  # (timestamp, weight) of each acquired request
+        self._used = 0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self, weight=1):
+        """Wait until weight fits in the current window, then claim it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._spent and now - self._spent[0][0] >= self.interval:
+                    self._used -= self._spent.popleft()[1]
+                if not self._spent or self._used + weight <= self.rate_limit:
+                    break
+                await asyncio.sleep(self.interval - (now - self._spent[0][0]))
+            self._spent.append((now, weight))
+            self._used += weight
+
+class AsyncBatcher:
+    """Coalesce items added within wait seconds into one call of fn
+    
+    fn takes a list of distinct items and returns a dict of results by item;
+    items it leaves out resolve to None. A batch is flushed early once it
+    holds max_size items.
+    """
+    
+    def __init__(self, fn, max_size=20, wait=0.05):
+        self.fn = fn
+        self.max_size = max_size
+        self.wait = wait
+        self._pending = {}  # item -> future of its result
+        self._timer = None
+        self._running = set()  # Flushes in flight, kept referenced
+    
+    async def add(self, items):
+        """Queue items for the next batch and wait for their results"""
+        loop = asyncio.get_running_loop()
+        futures = []
+        for item in items:
+            future = self._pending.get(item)
+            if future is None:
+                future = self._pending[item] = loop.create_future()
+                if len(self._pending) >= self.max_size:
+                    self._flush()
+            futures.append(future)
+        if self._pending and self._timer is None:
+            self._timer = loop.call_later(self.wait, self._flush)
+        
+        # Futures are shared by every caller asking for the same item, so
+        # shield them: cancelling one caller must not fail the others
+        results = await asyncio.gather(*(asyncio.shield(future) for future in futures))
+        return dict(zip(items, results))
+    
+    def _flush(self):
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+    
+    async def _run(self, batch):
+        try:
+            results = await self.fn(list(batch))
+            for item, future in batch.items():
+                if not future.done():
+                    future.set_result(results.get(item))
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            # On cancellation or any other BaseException, which propagates
+            # from here, cancel what is left so no caller waits forever
+            for future in batch.values():
+                if not future.done():
+                    future.cancel()
+
+class PagePool:
+    """Warm pages on one browser context, opened on demand up to size
+    
+    Pages go back to the pool after use, so later scrapes skip page setup;
+    waiting for a free page also caps how many profiles load at once.
+    """
+    
+    def __init__(self, context, size):
+        self.context = context
+        self.size = size
+        self._pages = []
+        self._idle = asyncio.Queue()
+        self._opening = 0
+    
+    async def _open_page(self):
+        self._opening += 1
+        try:
+            page = await self.context.new_page()
+        finally:
+            self._opening -= 1
+        self._pages.append(page)
+        return page
+    
+    @asynccontextmanager
+    async def page(self):
+        """Borrow a page, replacing it if it was closed or crashed"""
+        if self._idle.empty() and len(self._pages) + self._opening < self.size:
+            page = await self._open_page()
+        else:
+            page = await self._idle.get()
+            if page.is_closed():
+                self._pages.remove(page)
+                page = await self._open_page()
+        try:
+            yield page
+        finally:
+            self._idle.put_nowait(page)
+    
+    async def close(self):
+        """Close the pooled pages"""
+        for page in self._pages:
+            if not page.is_closed():
+                await page.close()
+        self._pages = []
+
 class TwitterScraper:
     def __init__(self):
         """Initialize the Twitter scraper"""
@@ -35,29 +257,182 @@ class TwitterScraper:
         self.context = None
         self.page = None
         self.playwright = None
+        self._http = None  # Shared aiohttp session, created lazily
+        self._market_cache = {}  # token -> (expires_at, market data)
+        self._last_stats = {}  # username -> (counter texts, scraped_at, stats)
         
-        # Initialize follower history storage
+        # Sorted follower histories loaded during the current leaderboard run,
+        # keyed by username, backed by data/history.db
         self.follower_history = {}
+        self._history_db = None  # Opened lazily
         self.last_update_time = None
         
         # Spike detection thresholds
         self.SPIKE_THRESHOLD_PERCENT = 5  # 5% increase in an hour is considered a spike
         self.RAPID_GROWTH_THRESHOLD = 1000  # 1000 followers per hour is rapid growth
         
-    def save_follower_data(self, username, followers_count):
-        """Save follower data with timestamp"""
-        try:
+        # Maximum concurrent HTTP requests per host, and the total time allowed
+        # for one request in seconds
+        self.HTTP_CONCURRENCY = 64
+        self.HTTP_TIMEOUT = 10
+        
+        # Optional Nitter-style mirror for reading follower counts without a
+        # browser; a mirror that fails is skipped for MIRROR_RETRY_SECONDS
+        self.HTTP_MIRROR = (os.getenv('TWITTER_HTTP_MIRROR') or '').rstrip('/')
+        self.MIRROR_RETRY_SECONDS = 60 * 60
+        self._mirror_failed_until = {}  # mirror -> monotonic time it is retried
+        
+        # Binance allows 1200 request weight per minute
+        self._throttler = AsyncThrottler(rate_limit=1200, interval=60)
+        
+        # Saved login session, so restarts can skip the login flow
+        self.STORAGE_STATE_PATH = Path('data') / 'twitter_state.json'
+        
+        # Recorded static assets, re-recorded once older than a day
+        self.STATIC_HAR_PATH = Path('data') / 'twitter_static.har.zip'
+        self.STATIC_HAR_MAX_AGE = 24 * 60 * 60
+        
+        # Warm pages kept per browser context for concurrent profile scrapes
+        self.PAGE_POOL_SIZE = 8
+        self._profile_pages = None  # Pool on the logged-in context, apart from self.page
+        self._leaderboard_context = None  # Opened lazily, reused across runs
+        self._leaderboard_pages = None
+        
+        # Follower samples are stored at most once a minute, and unchanged
+        # counts only every 15 minutes
+        self.MIN_SAMPLE_SECONDS = 60
+        self.UNCHANGED_SAMPLE_SECONDS = 15 * 60
+        
+        # Histories at least this long compute growth with NumPy
+        self.VECTORIZED_HISTORY_POINTS = 64
+        
+        # A profile whose counters are unchanged reuses its last full scrape for
+        # up to this many seconds, skipping the bio and tweet reads
+        self.STATS_REUSE_SECONDS = 30 * 60
+        
+        # Market data is reused for this many seconds, for up to this many tokens
+        self.MARKET_DATA_TTL = 60
+        self.MARKET_DATA_CACHE_SIZE = 256
+        
+        # Concurrent market data lookups share one Binance request; 20 symbols
+        # is the most a /ticker/24hr call gets at its lowest weight
+        self._market_batcher = AsyncBatcher(self._flush_market_batch, max_size=20, wait=0.05)
+        
+        # Quotes pushed by the Binance ticker stream, used while this fresh
+        self.TICKER_STREAM_MAX_AGE = 30
+        self._ticker_prices = {}  # symbol -> (received_at, data)
+        self._ticker_task = None
+        
+    def _get_history_db(self):
+        """Open the follower history database on first use"""
+        if self._history_db is None:
             data_dir = Path('data')
             data_dir.mkdir(exist_ok=True)
             
-            file_path = data_dir / f'{username}_history.json'
+            conn = sqlite3.connect(data_dir / 'history.db')
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS follower_history (
+                    username TEXT,
+                    ts INTEGER,
+                    followers INTEGER,
+                    PRIMARY KEY (username, ts)
+                ) WITHOUT ROWID
+            """)
+            conn.commit()
+            self._history_db = conn
+            
+            self._migrate_history_files(data_dir)
+        return self._history_db
+
+    def _migrate_history_files(self, data_dir):
+        """Move points from per-user JSON/NDJSON history files into the database"""
+        files = list(data_dir.glob('*_history.json')) + list(data_dir.glob('*_history.ndjson'))
+        for file_path in files:
+            # follower_history.json is the app's shared per-token history, not
+            # a per-user file, and is left in place like database.py does
+            if file_path.name == 'follower_history.json':
+                continue
+            username = file_path.name.rsplit('_history', 1)[0]
+            try:
+                with open(file_path, 'rb') as f:
+                    if file_path.suffix == '.ndjson':
+                        points = []
+                        for line in f:
+                            try:
+                                points.append(orjson.loads(line))
+                            except orjson.JSONDecodeError:
+                                continue  # Skip a line torn by an interrupted append
+                    else:
+                        points = orjson.loads(f.read())
+                
+                self._history_db.executemany(
+                    "INSERT OR REPLACE INTO follower_history (username, ts, followers) VALUES (?, ?, ?)",
+                    [(username, point['timestamp'], point['followers']) for point in points]
+                )
+                self._history_db.commit()
+                file_path.unlink()
+                logger.info(f"Migrated follower history from {file_path.name}")
+            except Exception as e:
+                self._history_db.rollback()
+                logger.error(f"Error migrating follower history from {file_path.name}: {str(e)}")
+
+    def _prune_history(self):
+        """Delete follower history older than 24 hours"""
+        cutoff_time = int(time.time()) - (24 * 60 * 60)
+        self._get_history_db().execute("DELETE FROM follower_history WHERE ts <= ?", (cutoff_time,))
+
+    def _load_history(self, username):
+        """Load a user's last 24 hours of follower history sorted by timestamp
+        
+        The history is cached in follower_history, so each user is queried at
+        most once per leaderboard run.
+        """
+        history = self.follower_history.get(username)
+        if history is None:
+            cutoff_time = int(time.time()) - (24 * 60 * 60)
+            rows = self._get_history_db().execute(
+                "SELECT ts, followers FROM follower_history WHERE username = ? AND ts > ? ORDER BY ts",
+                (username, cutoff_time)
+            )
+            history = [{'timestamp': ts, 'followers': followers} for ts, followers in rows]
+            self.follower_history[username] = history
+        return history
+
+    def save_follower_data(self, username, followers_count, commit=True):
+        """Save follower data with timestamp
+        
+        Args:
+            username (str): Account the sample belongs to
+            followers_count (int): Current follower count
+            commit (bool): Commit immediately; pass False to batch several
+                samples into the caller's commit
+        """
+        try:
             current_time = int(time.time())
             
-            # Load existing data
-            history = []
-            if file_path.exists():
-                with open(file_path, 'r') as f:
-                    history = json.load(f)
+            # Keep only last 24 hours of the existing data
+            cutoff_time = current_time - (24 * 60 * 60)
+            history = [point for point in self._load_history(username) if point['timestamp'] > cutoff_time]
+            
+            # Skip unchanged counts until a heartbeat point is due; growth
+            # lookups take the latest point at or before each cutoff, so
+            # these samples never change their results. A changed count
+            # arriving too soon after the last point overwrites that point
+            # instead, keeping points apart while history[-1] stays current.
+            if history:
+                last_point = history[-1]
+                age = current_time - last_point['timestamp']
+                if last_point['followers'] == followers_count and age < self.UNCHANGED_SAMPLE_SECONDS:
+                    return True
+                if age < self.MIN_SAMPLE_SECONDS:
+                    current_time = last_point['timestamp']
+            
+            # Replace any sample already stored for this second, as the
+            # primary key does
+            if history and history[-1]['timestamp'] == current_time:
+                history.pop()
             
             # Add new data point
             history.append({
@@ -65,17 +440,18 @@ class TwitterScraper:
                 'followers': followers_count
             })
             
-            # Keep only last 24 hours of data
-            cutoff_time = current_time - (24 * 60 * 60)
-            history = [point for point in history if point['timestamp'] > cutoff_time]
-            
             # Sort by timestamp
             history.sort(key=lambda x: x['timestamp'])
             
-            # Save updated history
-            with open(file_path, 'w') as f:
-                json.dump(history, f)
+            db = self._get_history_db()
+            db.execute(
+                "INSERT OR REPLACE INTO follower_history (username, ts, followers) VALUES (?, ?, ?)",
+                (username, current_time, followers_count)
+            )
+            if commit:
+                db.commit()
             
+            self.follower_history[username] = history
             return True
         except Exception as e:
             logger.error(f"Error saving follower data: {str(e)}")
@@ -99,30 +475,35 @@ class TwitterScraper:
         current_time = int(time.time())
         current_followers = history[-1]['followers']
         
-        # Define time intervals in seconds
-        intervals = {
-            'change_5m': 5 * 60,
-            'change_15m': 15 * 60,
-            'change_30m': 30 * 60,
-            'change_1h': 60 * 60,
-            'change_4h': 4 * 60 * 60,
-            'change_6h': 6 * 60 * 60,
-            'change_12h': 12 * 60 * 60,
-            'change_18h': 18 * 60 * 60,
-            'change_24h': 24 * 60 * 60
-        }
+        if len(history) >= self.VECTORIZED_HISTORY_POINTS:
+            # Look up every interval at once with searchsorted
+            count = len(history)
+            timestamps = np.fromiter((point['timestamp'] for point in history), dtype=np.int64, count=count)
+            followers = np.fromiter((point['followers'] for point in history), dtype=np.float64, count=count)
+            
+            idx = np.searchsorted(timestamps, current_time - _GROWTH_INTERVAL_SECONDS, side='right') - 1
+            interval_followers = np.where(idx >= 0, followers[np.maximum(idx, 0)], 0.0)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                changes = np.where(
+                    interval_followers > 0,
+                    (current_followers - interval_followers) / interval_followers * 100,
+                    0.0
+                )
+            return dict(zip(_GROWTH_INTERVALS, changes.tolist()))
         
         metrics = {}
+        timestamps = [point['timestamp'] for point in history]
+        oldest = timestamps[0]
         
         # Calculate changes for each interval
-        for interval_name, seconds in intervals.items():
-            interval_time = current_time - seconds
+        for interval_name, seconds in _GROWTH_INTERVALS.items():
+            # Intervals reaching past the oldest sample have no baseline
+            if current_time - seconds < oldest:
+                metrics[interval_name] = 0
+                continue
+            
             # Find the closest data point before the interval
-            interval_point = None
-            for point in reversed(history):
-                if point['timestamp'] <= interval_time:
-                    interval_point = point
-                    break
+            interval_point = _point_at_or_before(history, timestamps, current_time - seconds)
             
             if interval_point:
                 interval_followers = interval_point['followers']
@@ -139,19 +520,8 @@ class TwitterScraper:
     def _calculate_follower_growth(self, username):
         """Calculate follower growth over various time intervals"""
         try:
-            file_path = Path('data') / f'{username}_history.json'
-            if not file_path.exists():
-                return {
-                    'change_5m': 0, 'change_15m': 0, 'change_30m': 0,
-                    'change_1h': 0, 'change_4h': 0, 'change_6h': 0,
-                    'change_12h': 0, 'change_18h': 0, 'change_24h': 0,
-                    'growth_rate': 0
-                }
-
-            with open(file_path, 'r') as f:
-                history = json.load(f)
-
-            if not history:
+            data_points = self._load_history(username)
+            if not data_points:
                 return {
                     'change_5m': 0, 'change_15m': 0, 'change_30m': 0,
                     'change_1h': 0, 'change_4h': 0, 'change_6h': 0,
@@ -159,8 +529,6 @@ class TwitterScraper:
                     'growth_rate': 0
                 }
 
-            # Sort data points by timestamp
-            data_points = sorted(history, key=lambda x: x['timestamp'])
             current_time = int(time.time())
             current_followers = data_points[-1]['followers']
 
@@ -187,29 +555,16 @@ class TwitterScraper:
     def detect_follower_spike(self, username, current_followers):
         """Detect if there's a significant spike in followers"""
         try:
-            file_path = Path('data') / f'{username}_history.json'
-            if not file_path.exists():
+            data_points = self._load_history(username)
+            if not data_points:
                 return False, 0
             
-            with open(file_path, 'r') as f:
-                history = json.load(f)
-            
-            if not history:
-                return False, 0
-            
-            # Sort data points by timestamp
-            data_points = sorted(history, key=lambda x: x['timestamp'])
-            
-            # Get the oldest data point within the last hour
+            # Get the latest data point from at least an hour ago
             current_time = int(time.time())
             hour_ago = current_time - 3600
             
-            old_point = None
-            for point in data_points:
-                if point['timestamp'] <= hour_ago:
-                    old_point = point
-                else:
-                    break
+            timestamps = [point['timestamp'] for point in data_points]
+            old_point = _point_at_or_before(data_points, timestamps, hour_ago)
             
             if not old_point:
                 return False, 0
@@ -251,13 +606,18 @@ class TwitterScraper:
 
             logger.info("Browser launched successfully")
 
-            # Create context with explicit wait
+            # Create context with explicit wait, restoring the saved login
+            # session if there is one
+            storage_state = self.STORAGE_STATE_PATH if self.STORAGE_STATE_PATH.exists() else None
             self.context = await self.browser.new_context(
                 viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+                storage_state=storage_state
             )
             if not self.context:
                 raise Exception("Failed to create browser context")
+            await self._block_heavy_resources(self.context)
+            await self._replay_static_assets(self.context, record=True)
 
             logger.info("Browser context created successfully")
 
@@ -281,10 +641,15 @@ class TwitterScraper:
                 except Exception as nav_error:
                     raise Exception(f"Failed to verify page functionality: {str(nav_error)}")
 
-                # Login to Twitter
-                await self._login()
-                logger.info("Twitter login successful")
+                # Login to Twitter unless the restored session is still valid
+                if storage_state and await self._is_logged_in():
+                    logger.info("Reusing saved Twitter session")
+                else:
+                    await self._login()
+                    await self._save_storage_state()
+                    logger.info("Twitter login successful")
                 
+                self._profile_pages = PagePool(self.context, self.PAGE_POOL_SIZE)
                 return self
                 
             except Exception as page_error:
@@ -298,6 +663,35 @@ class TwitterScraper:
             await self._cleanup_resources()
             raise Exception(error_msg)
 
+    async def _block_heavy_resources(self, context):
+        """Abort image, media, font and stylesheet requests; scraping only needs the DOM text"""
+        async def handle(route):
+            if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+                await route.abort()
+            else:
+                await route.continue_()
+        
+        await context.route('**/*', handle)
+
+    async def _replay_static_assets(self, context, record=False):
+        """Serve Twitter's static bundles from the recorded HAR
+        
+        Routing disables the browser cache, so without this every profile load
+        downloads the same JS again. Requests missing from the HAR, and all
+        live data, go to the network. With record set, a missing or stale HAR
+        is re-recorded and written when the context closes.
+        """
+        har = self.STATIC_HAR_PATH
+        fresh = har.exists() and time.time() - har.stat().st_mtime < self.STATIC_HAR_MAX_AGE
+        if not fresh and not record:
+            return
+        
+        try:
+            har.parent.mkdir(exist_ok=True)
+            await context.route_from_har(har, url=_STATIC_ASSET_URLS, not_found='fallback', update=not fresh)
+        except Exception as e:
+            logger.warning(f"Not replaying static assets from {har}: {str(e)}")
+
     async def _cleanup_resources(self):
         """Clean up browser resources"""
         try:
@@ -312,13 +706,29 @@ class TwitterScraper:
         except Exception as e:
             logger.error(f"Error during cleanup: {str(e)}")
 
+    async def _is_logged_in(self):
+        """Check whether the current context has a valid Twitter session"""
+        try:
+            await self.page.goto('https://twitter.com/home', wait_until='domcontentloaded', timeout=30000)
+            await self.page.wait_for_selector('[data-testid="primaryColumn"]', timeout=15000)
+            return 'login' not in self.page.url
+        except Exception as e:
+            logger.warning(f"Saved Twitter session is no longer valid: {str(e)}")
+            return False
+
+    async def _save_storage_state(self):
+        """Persist the context's cookies and local storage for the next start"""
+        try:
+            self.STORAGE_STATE_PATH.parent.mkdir(exist_ok=True)
+            await self.context.storage_state(path=self.STORAGE_STATE_PATH)
+        except Exception as e:
+            logger.error(f"Error saving Twitter session: {str(e)}")
+
     async def _login(self):
         """Login to Twitter using Playwright"""
         try:
-            # Navigate to login page
-            await self.page.goto('https://twitter.com/i/flow/login', timeout=60000)
-            await self.page.wait_for_load_state('networkidle', timeout=60000)
-            await asyncio.sleep(2)
+            # Navigate to login page; the username field is the readiness signal
+            await self.page.goto('https://twitter.com/i/flow/login', wait_until='domcontentloaded', timeout=60000)
             
             # Enter username
             username_input = await self.page.wait_for_selector('input[autocomplete="username"]', timeout=30000)
@@ -327,26 +737,24 @@ class TwitterScraper:
             
             await username_input.fill(self.username)
             await username_input.press('Enter')
-            await asyncio.sleep(2)
             
-            # Handle additional security if username is phone/email
-            try:
-                security_input = await self.page.wait_for_selector('input[data-testid="ocfEnterTextTextInput"]', timeout=5000)
-                if security_input:
-                    await security_input.fill(self.username)
-                    await security_input.press('Enter')
-                    await asyncio.sleep(2)
-            except:
-                pass  # No security check needed
+            # Whichever comes next wins: the password field, or the extra
+            # security check shown when the username is a phone/email
+            next_input = await self.page.wait_for_selector(
+                'input[name="password"], input[data-testid="ocfEnterTextTextInput"]', timeout=30000
+            )
+            if next_input and await next_input.get_attribute('name') != 'password':
+                await next_input.fill(self.username)
+                await next_input.press('Enter')
+                next_input = await self.page.wait_for_selector('input[name="password"]', timeout=30000)
             
             # Enter password
-            password_input = await self.page.wait_for_selector('input[name="password"]', timeout=30000)
+            password_input = next_input
             if not password_input:
                 raise Exception("Password input field not found")
             
             await password_input.fill(self.password)
             await password_input.press('Enter')
-            await asyncio.sleep(3)
             
             # Verify login success
             try:
@@ -382,54 +790,47 @@ class TwitterScraper:
             logger.error(f"Error logging in to Twitter: {str(e)}")
             raise
 
-    def _parse_number(self, text):
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse_number(text):
         """Parse number from text (e.g., '1.5K' to 1500)"""
         if not text:
             return 0
-        text = str(text).strip().upper()
-        text = re.sub(r'[^\d.KM]', '', text)
+        text = _NUMBER_STRIP_RE.sub('', str(text).strip().upper())
         multiplier = 1
-        
-        if 'K' in text:
-            multiplier = 1000
-            text = text.replace('K', '')
-        elif 'M' in text:
-            multiplier = 1000000
-            text = text.replace('M', '')
+        for suffix, suffix_multiplier in _NUMBER_MULTIPLIERS.items():
+            if suffix in text:
+                multiplier = suffix_multiplier
+                # Also drop suffix letters left over from words like 'Likes'
+                text = text.translate(_NUMBER_SUFFIXES)
+                break
             
         try:
             return int(float(text) * multiplier)
-        except:
+        except ValueError:
             return 0
 
     def _calculate_twitter_score(self, followers, engagement_rate, verified):
-        """
-        Calculate Twitter Score similar to TwitterScore.io
-        Score is based on followers, engagement rate, and verification status
-        """
-        # Base score from followers (logarithmic scale)
-        if followers <= 0:
-            return 0
-        
-        follower_score = (1000 * (1 + math.log10(followers))) / 7
-        
-        # Engagement multiplier (0.5 to 2.0)
-        engagement_multiplier = 1 + (engagement_rate * 100)  # Convert to percentage
-        engagement_multiplier = max(0.5, min(2.0, engagement_multiplier))
-        
-        # Verification bonus
-        verification_bonus = 1.2 if verified else 1.0
-        
-        # Calculate final score
-        score = follower_score * engagement_multiplier * verification_bonus
-        
-        # Normalize to 0-1000 scale
-        normalized_score = min(1000, max(0, int(score)))
-        
-        return normalized_score
+        """Calculate the Twitter Score of one profile, with the same formula as _twitter_scores"""
+        scores = _twitter_scores(
+            np.array([followers], dtype=np.float64),
+            np.array([engagement_rate], dtype=np.float64),
+            np.array([bool(verified)], dtype=np.bool_)
+        )
+        return int(scores[0])
 
-    async def scrape_account_stats(self, username):
-        """Scrape account statistics using Playwright"""
+    async def scrape_account_stats(self, username, page=None):
+        """Scrape account statistics using Playwright, on the given page or a pooled one"""
+        if page is None and self._profile_pages is not None:
+            # Never share the main page with scrapes running on pooled pages;
+            # failing to get one fails only this account
+            try:
+                async with self._profile_pages.page() as pooled_page:
+                    return await self.scrape_account_stats(username, pooled_page)
+            except Exception as e:
+                logger.error(f"Error scraping account stats for {username}: {str(e)}")
+                return None
+        page = page or self.page
         try:
             # Navigate to profile page with retry logic
             max_retries = 3
@@ -438,7 +839,7 @@ class TwitterScraper:
             while retry_count < max_retries:
                 try:
                     # Use a more reliable navigation strategy
-                    await self.page.goto(
+                    await page.goto(
                         f'https://twitter.com/{username}',
                         wait_until='domcontentloaded',  # Changed from networkidle to domcontentloaded
                         timeout=30000  # Reduced timeout to 30 seconds
@@ -446,7 +847,7 @@ class TwitterScraper:
                     
                     # Wait for specific elements instead of networkidle
                     try:
-                        await self.page.wait_for_selector('[data-testid="UserName"]', timeout=20000)
+                        await page.wait_for_selector('[data-testid="UserName"]', timeout=20000)
                         break
                     except Exception as wait_error:
                         logger.warning(f"Waiting for profile elements: {str(wait_error)}")
@@ -474,11 +875,10 @@ class TwitterScraper:
             while retry_count < max_retries:
                 try:
                     # Wait for stats to load
-                    await self.page.wait_for_selector('[data-testid="primaryColumn"]', timeout=10000)
+                    await page.wait_for_selector('[data-testid="primaryColumn"]', timeout=10000)
                     await asyncio.sleep(2)  # Give time for dynamic content to load
                     
                     # Try multiple selector patterns
-                    stats = {'followers': '0', 'following': '0', 'tweets': '0'}
                     patterns = [
                         # New Twitter structure
                         'a[href*="/following"] span span',
@@ -489,27 +889,30 @@ class TwitterScraper:
                         'div[data-testid="UserProfileHeader_Items"] span'
                     ]
                     
-                    for pattern in patterns:
-                        elements = await self.page.query_selector_all(pattern)
-                        for elem in elements:
-                            if not elem:
-                                continue
+                    # Match every pattern inside the browser in one round trip
+                    stats = await page.evaluate('''(patterns) => {
+                        const stats = {followers: '0', following: '0', tweets: '0'};
+                        for (const pattern of patterns) {
+                            for (const elem of document.querySelectorAll(pattern)) {
+                                const text = elem.textContent;
+                                if (!text || !/[0-9]/.test(text)) continue;
                                 
-                            text = await elem.text_content()
-                            if not text or not any(c.isdigit() for c in text):
-                                continue
+                                const grandparent = elem.parentElement && elem.parentElement.parentElement;
+                                const parent = grandparent ? grandparent.innerHTML.toLowerCase() : '';
+                                if (!parent) continue;
                                 
-                            parent = await elem.evaluate('node => node.parentElement.parentElement.innerHTML')
-                            if not parent:
-                                continue
-                                
-                            parent = parent.lower()
-                            if 'following' in parent and stats['following'] == '0':
-                                stats['following'] = text.split(' ')[0]
-                            elif 'followers' in parent and stats['followers'] == '0':
-                                stats['followers'] = text.split(' ')[0]
-                            elif ('posts' in parent or 'tweets' in parent) and stats['tweets'] == '0':
-                                stats['tweets'] = text.split(' ')[0]
+                                const value = text.split(' ')[0];
+                                if (parent.includes('following') && stats.following === '0') {
+                                    stats.following = value;
+                                } else if (parent.includes('followers') && stats.followers === '0') {
+                                    stats.followers = value;
+                                } else if ((parent.includes('posts') || parent.includes('tweets')) && stats.tweets === '0') {
+                                    stats.tweets = value;
+                                }
+                            }
+                        }
+                        return stats;
+                    }''', patterns)
                     
                     # Verify we got at least some stats
                     if stats['followers'] == '0' and stats['following'] == '0' and stats['tweets'] == '0':
@@ -517,7 +920,7 @@ class TwitterScraper:
                         
                     # Take a screenshot for debugging if needed
                     if retry_count > 0:
-                        await self.page.screenshot(path=f'debug_stats_{username}.png')
+                        await page.screenshot(path=f'debug_stats_{username}.png')
                         
                     break
                 except Exception as e:
@@ -527,44 +930,54 @@ class TwitterScraper:
                     logger.warning(f"Retry {retry_count}/{max_retries} for stats collection: {str(e)}")
                     await asyncio.sleep(3)
             
-            # Get location with shorter timeout
-            try:
-                location_elem = await self.page.wait_for_selector('[data-testid="UserLocation"]', timeout=5000)
-                location = await location_elem.text_content() if location_elem else ""
-            except:
-                location = ""
-                    
-            # Get verification status
-            try:
-                verified = await self.page.is_visible('[data-testid="UserName"] [aria-label*="Verified"]', timeout=5000)
-            except:
-                verified = False
-                    
-            # Get bio with shorter timeout
+            # Unchanged counters mean an unchanged profile, so reuse the last scrape
+            counters = (stats['followers'], stats['following'], stats['tweets'])
+            last = self._last_stats.get(username)
+            if last and last[0] == counters and time.monotonic() - last[1] < self.STATS_REUSE_SECONDS:
+                logger.info(f"Stats unchanged for {username}, reusing the last scrape")
+                return dict(last[2], created_at=datetime.now().strftime('%Y-%m-%d'))
+            
+            # Get location, verification status and bio in one round trip; the
+            # profile has rendered by now, so missing elements are simply absent
             try:
-                bio_elem = await self.page.wait_for_selector('[data-testid="UserDescription"]', timeout=5000)
-                bio = await bio_elem.text_content() if bio_elem else ""
-            except:
-                bio = ""
+                profile = await page.evaluate('''() => {
+                    const location = document.querySelector('[data-testid="UserLocation"]');
+                    const bio = document.querySelector('[data-testid="UserDescription"]');
+                    return {
+                        location: location ? location.textContent : '',
+                        verified: !!document.querySelector('[data-testid="UserName"] [aria-label*="Verified"]'),
+                        bio: bio ? bio.textContent : ''
+                    };
+                }''')
+            except Exception:
+                profile = {'location': '', 'verified': False, 'bio': ''}
+            location = profile['location']
+            verified = profile['verified']
+            bio = profile['bio']
             
             # Calculate engagement rate from recent tweets with shorter timeouts
-            tweets = await self.page.query_selector_all('[data-testid="tweet"]')
+            # Read the counters of up to 5 recent tweets in one round trip
+            tweets = await page.evaluate('''() => {
+                const count = (tweet, testId) => {
+                    const elem = tweet.querySelector(`[data-testid="${testId}"]`);
+                    return elem ? elem.textContent : null;
+                };
+                return Array.from(document.querySelectorAll('[data-testid="tweet"]'))
+                    .slice(0, 5)
+                    .map(tweet => ({
+                        likes: count(tweet, 'like'),
+                        retweets: count(tweet, 'retweet'),
+                        replies: count(tweet, 'reply')
+                    }));
+            }''')
             total_engagement = 0
-            total_tweets = min(len(tweets), 5)  # Look at up to 5 recent tweets
+            total_tweets = len(tweets)
             
-            for tweet in tweets[:total_tweets]:
+            for tweet in tweets:
                 try:
-                    # Get likes
-                    like_elem = await tweet.query_selector('[data-testid="like"]')
-                    likes = self._parse_number(await like_elem.text_content()) if like_elem else 0
-                    
-                    # Get retweets
-                    retweet_elem = await tweet.query_selector('[data-testid="retweet"]')
-                    retweets = self._parse_number(await retweet_elem.text_content()) if retweet_elem else 0
-                    
-                    # Get replies
-                    reply_elem = await tweet.query_selector('[data-testid="reply"]')
-                    replies = self._parse_number(await reply_elem.text_content()) if reply_elem else 0
+                    likes = self._parse_number(tweet['likes'])
+                    retweets = self._parse_number(tweet['retweets'])
+                    replies = self._parse_number(tweet['replies'])
                     
                     # Calculate weighted engagement
                     weighted_engagement = likes + (retweets * 2) + (replies * 1.5)
@@ -598,6 +1011,7 @@ class TwitterScraper:
                 )
             }
             
+            self._last_stats[username] = (counters, time.monotonic(), result)
             logger.info(f"Successfully scraped stats for {username}: {result}")
             return result
                     
@@ -611,26 +1025,28 @@ class TwitterScraper:
             results = []
             alerts = []
             
-            # Create a new browser context for parallel scraping
-            context = await self.browser.new_context()
+            # Reload follower histories from disk once for this run
+            self.follower_history.clear()
+            
+            # Scrape in a separate browser context, kept warm between runs
+            if self._leaderboard_context is None:
+                context = await self.browser.new_context(viewport={'width': 1920, 'height': 1080})
+                await self._block_heavy_resources(context)
+                await self._replay_static_assets(context)
+                self._leaderboard_context = context
+                self._leaderboard_pages = PagePool(context, self.PAGE_POOL_SIZE)
             
             async def scrape_token(token):
                 try:
-                    # Create a new page for each token
-                    page = await context.new_page()
-                    
-                    # Configure page
-                    await page.set_viewport_size({"width": 1920, "height": 1080})
-                    
-                    # Get Twitter stats
-                    stats = await self._scrape_account_stats_parallel(page, token)
+                    # Get Twitter stats, holding a pooled page only while scraping
+                    async with self._leaderboard_pages.page() as page:
+                        stats = await self._scrape_account_stats_parallel(page, token)
                     if not stats:
-                        await page.close()
                         return None
                         
                     # Save follower data for tracking
                     followers_count = stats['followers_count']
-                    self.save_follower_data(token, followers_count)
+                    self.save_follower_data(token, followers_count, commit=False)
                     
                     # Check for follower spikes
                     is_spike, spike_percent = self.detect_follower_spike(token, followers_count)
@@ -679,7 +1095,6 @@ class TwitterScraper:
                         }
                     }
                     
-                    await page.close()
                     return token_data
                     
                 except Exception as e:
@@ -690,9 +1105,28 @@ class TwitterScraper:
             tasks = [scrape_token(token) for token in tokens]
             scraped_data = await asyncio.gather(*tasks)
             
+            # Drop expired history and commit this run's samples together
+            try:
+                self._prune_history()
+                self._get_history_db().commit()
+            except Exception as e:
+                logger.error(f"Error committing follower history: {str(e)}")
+            
             # Filter out None results and add to results list
             results = [data for data in scraped_data if data is not None]
             
+            # Score every scraped profile in one vectorized pass
+            if results:
+                stats = [data['twitter_stats'] for data in results]
+                count = len(stats)
+                scores = _twitter_scores(
+                    np.fromiter((row['followers_count'] for row in stats), dtype=np.float64, count=count),
+                    np.fromiter((row['engagement_rate'] for row in stats), dtype=np.float64, count=count),
+                    np.fromiter((bool(row['verified']) for row in stats), dtype=np.bool_, count=count)
+                )
+                for row, score in zip(stats, scores.tolist()):
+                    row['twitter_score'] = score
+            
             # Sort by growth rate when there are spikes, otherwise by Twitter score
             results.sort(key=lambda x: (
                 x['follower_metrics']['is_spiking'],
@@ -700,7 +1134,6 @@ class TwitterScraper:
                 x['twitter_stats']['twitter_score']
             ), reverse=True)
             
-            await context.close()
             return results, alerts
             
         except Exception as e:
@@ -708,35 +1141,29 @@ class TwitterScraper:
             return None, []
 
     async def _scrape_account_stats_parallel(self, page, username):
-        """Scrape account statistics using a specific page"""
+        """Scrape account statistics using a specific page
+        
+        The twitter_score is left to the caller, which scores all profiles at once.
+        """
         try:
             await page.goto(f'https://twitter.com/{username}', wait_until='domcontentloaded')
             await page.wait_for_selector('[data-testid="UserName"]', timeout=10000)
             
-            # Get follower count
-            followers_text = await page.evaluate('''() => {
-                const elements = document.querySelectorAll('a[href*="/followers"] span span');
-                for (const elem of elements) {
-                    const text = elem.textContent;
-                    if (text && /^[0-9,.KMB]+$/.test(text.trim())) {
-                        return text.trim();
-                    }
-                }
-                return '0';
-            }''')
-            
-            followers_count = self._parse_number(followers_text)
-            
-            # Get bio
-            bio = await page.evaluate('''() => {
-                const bioElem = document.querySelector('[data-testid="UserDescription"]');
-                return bioElem ? bioElem.textContent : '';
+            # Get follower count, bio and verification status in one round trip
+            profile = await page.evaluate('''() => {
+                const link = document.querySelector('a[href$="/verified_followers"], a[href$="/followers"]');
+                const count = link && link.querySelector('span span');
+                const bio = document.querySelector('[data-testid="UserDescription"]');
+                return {
+                    followers: count ? count.textContent.trim() : '0',
+                    bio: bio ? bio.textContent : '',
+                    verified: !!document.querySelector('[data-testid="UserName"] svg[aria-label*="Verified"]')
+                };
             }''')
             
-            # Get verification status
-            verified = await page.evaluate('''() => {
-                return !!document.querySelector('[data-testid="UserName"] svg[aria-label*="Verified"]');
-            }''')
+            followers_count = self._parse_number(profile['followers'])
+            bio = profile['bio']
+            verified = profile['verified']
             
             # Calculate engagement rate (simplified for parallel processing)
             engagement_rate = 0.001  # Default value
@@ -746,98 +1173,211 @@ class TwitterScraper:
                 'followers_count': followers_count,
                 'bio': bio,
                 'verified': verified,
-                'engagement_rate': engagement_rate,
-                'twitter_score': self._calculate_twitter_score(followers_count, engagement_rate, verified)
+                'engagement_rate': engagement_rate
             }
             
         except Exception as e:
             logger.error(f"Error scraping account stats for {username}: {str(e)}")
             return None
 
-    async def get_market_data(self, tokens):
-        """Get market data from Binance API"""
+    async def _get_session(self):
+        """Get the shared HTTP session, creating it on first use"""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=self.HTTP_CONCURRENCY,
+                    keepalive_timeout=75,
+                    ttl_dns_cache=300
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.HTTP_TIMEOUT)
+            )
+        return self._http
+
+    async def _get_json(self, session, url, max_attempts=5, weight=1):
+        """GET a JSON resource, retrying rate limits and server errors with exponential backoff
+        
+        Every attempt is throttled by its Binance request weight.
+        
+        Returns:
+            The decoded JSON body, or None if the request failed permanently
+        """
+        for attempt in range(max_attempts):
+            delay = 2 ** attempt
+            await self._throttler.acquire(weight)
+            try:
+                async with session.get(url) as response:
+                    if response.status == 200:
+                        return orjson.loads(await response.read())
+                    
+                    if response.status in (418, 429):
+                        # Rate limited (418 is Binance's ban status): honour Retry-After if given
+                        try:
+                            delay = float(response.headers.get('Retry-After', delay))
+                        except ValueError:
+                            pass
+                    elif response.status < 500:
+                        logger.error(f"Request to {url} failed with status {response.status}")
+                        return None
+                    
+                    reason = f"status {response.status}"
+            except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError) as e:
+                reason = str(e) or type(e).__name__
+            
+            if attempt + 1 < max_attempts:
+                logger.warning(f"Retry {attempt + 1}/{max_attempts} for {url} in {delay:.0f}s: {reason}")
+                await asyncio.sleep(delay)
+        
+        logger.error(f"Giving up on {url} after {max_attempts} attempts")
+        return None
+
+    async def _fetch_market_data(self, session, base_url, symbols):
+        """Fetch price and 24h stats for several Binance symbols in one request
+        
+        Returns:
+            Dict mapping each symbol to its market data; symbols that could not be
+            fetched are left out
+        """
         try:
-            # Map Twitter usernames to Binance trading pairs
-            symbol_map = {
-                'bitcoin': 'BTCUSDT',
-                'ethereum': 'ETHUSDT',
-                'binance': 'BNBUSDT',
-                'dogecoin': 'DOGEUSDT',
-                'cardano': 'ADAUSDT',
-                'solana': 'SOLUSDT',
-                'ripple': 'XRPUSDT',
-                'polkadot': 'DOTUSDT',
-                'avalanche': 'AVAXUSDT',
-                'chainlink': 'LINKUSDT'
-            }
+            # /ticker/24hr takes a JSON array of symbols and includes the last price
+            query = quote(orjson.dumps(symbols).decode(), safe='')
+            tickers = await self._get_json(session, f"{base_url}/ticker/24hr?symbols={query}", weight=_ticker_weight(len(symbols)))
+            if tickers is None:
+                if len(symbols) == 1:
+                    return {}
+                # One bad symbol fails the whole batch, so fall back to
+                # concurrent per-symbol requests
+                tickers = await asyncio.gather(*(
+                    self._get_json(session, f"{base_url}/ticker/24hr?symbol={symbol}", max_attempts=2, weight=_ticker_weight(1))
+                    for symbol in symbols
+                ))
+                tickers = [ticker for ticker in tickers if ticker is not None]
             
             market_data = {}
+            for ticker in tickers:
+                price = float(ticker['lastPrice'])
+                market_data[ticker['symbol']] = {
+                    'price': price,
+                    'price_change_24h': float(ticker['priceChangePercent']),
+                    'market_cap': float(ticker['quoteVolume']) * price  # Using quote volume as proxy for market cap
+                }
+            return market_data
+            
+        except Exception as e:
+            logger.error(f"Error fetching market data for {', '.join(symbols)}: {str(e)}")
+            return {}
+
+    async def _scrape_followers_http(self, username):
+        """Read a follower count from the HTTP mirror, without the browser
+        
+        Returns:
+            The follower count, or None if no mirror is usable
+        """
+        mirror = self.HTTP_MIRROR
+        if not mirror or self._mirror_failed_until.get(mirror, 0) > time.monotonic():
+            return None
+        
+        try:
+            session = await self._get_session()
+            async with session.get(f"{mirror}/{username}") as response:
+                if response.status == 200:
+                    match = _MIRROR_FOLLOWERS_RE.search(await response.text())
+                    if match:
+                        self._mirror_failed_until.pop(mirror, None)
+                        return self._parse_number(match.group(1))
+                reason = f"status {response.status}" if response.status != 200 else "no follower count"
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            reason = str(e) or type(e).__name__
+        
+        logger.warning(f"HTTP mirror {mirror} failed for {username} ({reason}), using the browser")
+        self._mirror_failed_until[mirror] = time.monotonic() + self.MIRROR_RETRY_SECONDS
+        return None
+
+    def _ensure_ticker_stream(self):
+        """Start the ticker stream for every known symbol, unless it is running"""
+        if self._ticker_task is None or self._ticker_task.done():
+            self._ticker_task = asyncio.create_task(self._start_ticker_stream(list(_BINANCE_SYMBOLS.values())))
+
+    async def _start_ticker_stream(self, symbols):
+        """Keep _ticker_prices updated from Binance's combined ticker stream
+        
+        Pushed updates cost no request weight; the stream reconnects with
+        exponential backoff and REST covers any gap while it is down.
+        """
+        url = _BINANCE_STREAM_URL + '/'.join(f"{symbol.lower()}@ticker" for symbol in symbols)
+        delay = 1
+        while True:
+            try:
+                session = await self._get_session()
+                async with session.ws_connect(url, heartbeat=30) as ws:
+                    delay = 1
+                    async for msg in ws:
+                        if msg.type != aiohttp.WSMsgType.TEXT:
+                            break
+                        ticker = orjson.loads(msg.data)['data']
+                        price = float(ticker['c'])
+                        self._ticker_prices[ticker['s']] = (time.monotonic(), {
+                            'price': price,
+                            'price_change_24h': float(ticker['P']),
+                            'market_cap': float(ticker['q']) * price  # Using quote volume as proxy for market cap
+                        })
+                reason = "connection closed"
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                reason = str(e) or type(e).__name__
             
+            logger.warning(f"Binance ticker stream stopped ({reason}), reconnecting in {delay}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 60)
+
+    async def _flush_market_batch(self, symbols):
+        """Fetch one batch of symbols queued by _market_batcher"""
+        session = await self._get_session()
+        return await self._fetch_market_data(session, "https://api.binance.com/api/v3", symbols)
+
+    async def get_market_data(self, tokens):
+        """Get market data from Binance API"""
+        try:
             # Handle both single token and list of tokens
             if isinstance(tokens, str):
                 tokens = [tokens]
             
-            # Fetch data from Binance API
-            base_url = "https://api.binance.com/api/v3"
+            # Prefer live ticker stream quotes, then tokens fetched within the
+            # last MARKET_DATA_TTL seconds from cache
+            self._ensure_ticker_stream()
+            now = time.monotonic()
+            market_data = {}
+            for token in tokens:
+                streamed = self._ticker_prices.get(_BINANCE_SYMBOLS.get(token.lower()))
+                if streamed and now - streamed[0] < self.TICKER_STREAM_MAX_AGE:
+                    market_data[token] = streamed[1]
+                    continue
+                cached = self._market_cache.get(token)
+                if cached and cached[0] > now:
+                    market_data[token] = cached[1]
+            missing = [token for token in tokens if token not in market_data]
+            if not missing:
+                return market_data
             
-            async with aiohttp.ClientSession() as session:
-                for token in tokens:
-                    try:
-                        # Get symbol for the token
-                        symbol = symbol_map.get(token.lower())
-                        if not symbol:
-                            market_data[token] = {
-                                'price': 0,
-                                'price_change_24h': 0,
-                                'market_cap': 0
-                            }
-                            continue
-                        
-                        # Get current price
-                        price_url = f"{base_url}/ticker/price?symbol={symbol}"
-                        async with session.get(price_url) as response:
-                            if response.status == 200:
-                                price_data = await response.json()
-                                price = float(price_data['price'])
-                            else:
-                                market_data[token] = {
-                                    'price': 0,
-                                    'price_change_24h': 0,
-                                    'market_cap': 0
-                                }
-                                continue
-                        
-                        # Get 24h price change and volume
-                        stats_url = f"{base_url}/ticker/24hr?symbol={symbol}"
-                        async with session.get(stats_url) as response:
-                            if response.status == 200:
-                                stats_data = await response.json()
-                                price_change = float(stats_data['priceChangePercent'])
-                                volume = float(stats_data['quoteVolume'])
-                                market_cap = volume * price  # Using quote volume as proxy for market cap
-                            else:
-                                market_data[token] = {
-                                    'price': 0,
-                                    'price_change_24h': 0,
-                                    'market_cap': 0
-                                }
-                                continue
-                        
-                        market_data[token] = {
-                            'price': price,
-                            'price_change_24h': price_change,
-                            'market_cap': market_cap
-                        }
-                        
-                    except Exception as e:
-                        logger.error(f"Error fetching market data for {token}: {str(e)}")
-                        market_data[token] = {
-                            'price': 0,
-                            'price_change_24h': 0,
-                            'market_cap': 0
-                        }
+            # Fetch every known symbol from Binance API, batched with any
+            # other lookups made at the same time
+            symbols = list(dict.fromkeys(_BINANCE_SYMBOLS[token.lower()] for token in missing if token.lower() in _BINANCE_SYMBOLS))
+            fetched = await self._market_batcher.add(symbols) if symbols else {}
             
-            return market_data
+            expires_at = time.monotonic() + self.MARKET_DATA_TTL
+            for token in missing:
+                result = fetched.get(_BINANCE_SYMBOLS.get(token.lower())) or {'price': 0, 'price_change_24h': 0, 'market_cap': 0}
+                market_data[token] = result
+                # Only cache real quotes so failed lookups are retried next time
+                if result['price']:
+                    self._market_cache.pop(token, None)
+                    self._market_cache[token] = (expires_at, result)
+            
+            # Evict the oldest entries past the size limit
+            while len(self._market_cache) > self.MARKET_DATA_CACHE_SIZE:
+                del self._market_cache[next(iter(self._market_cache))]
+            
+            return {token: market_data[token] for token in tokens}
             
         except Exception as e:
             logger.error(f"Error fetching market data: {str(e)}")
@@ -846,13 +1386,10 @@ class TwitterScraper:
     async def get_twitter_data(self, usernames):
         """Get Twitter data for the given usernames"""
         try:
-            twitter_data = {}
-            for username in usernames:
-                # Scrape Twitter stats
-                stats = await self.scrape_account_stats(username)
-                if stats:
-                    twitter_data[username] = stats
-            return twitter_data
+            # Each scrape borrows one of the warm pages of the logged-in
+            # context, so the pool size caps how many run at once
+            results = await asyncio.gather(*(self.scrape_account_stats(username) for username in usernames))
+            return {username: stats for username, stats in zip(usernames, results) if stats}
         except Exception as e:
             logger.error(f"Error getting Twitter data: {str(e)}")
             return {}
@@ -863,25 +1400,35 @@ class TwitterScraper:
             follower_data = []
             intervals = int((duration_hours * 60) / interval_minutes)
             
+            # Poll i is due interval_minutes * i after the start, so scrape
+            # time does not push later polls back
+            loop = asyncio.get_running_loop()
+            deadline = loop.time()
+            
             for i in range(intervals + 1):
                 current_time = datetime.now()
-                stats = await self.scrape_account_stats(username)
                 
-                if stats:
+                # Only the follower count is needed, so try the HTTP mirror first
+                current_followers = await self._scrape_followers_http(username)
+                if current_followers is None:
+                    stats = await self.scrape_account_stats(username)
+                    current_followers = stats['followers_count'] if stats else None
+                
+                if current_followers is not None:
                     follower_data.append({
                         'timestamp': current_time.strftime('%Y-%m-%d %H:%M:%S'),
-                        'followers': stats['followers_count']
+                        'followers': current_followers
                     })
                     
                     if i > 0:
                         initial_followers = follower_data[0]['followers']
-                        current_followers = stats['followers_count']
                         if initial_followers > 0:
                             percent_change = ((current_followers - initial_followers) / initial_followers) * 100
                             logger.info(f"Follower change after {i*interval_minutes} minutes: {percent_change:.2f}%")
                 
                 if i < intervals:
-                    await asyncio.sleep(interval_minutes * 60)
+                    deadline += interval_minutes * 60
+                    await asyncio.sleep(max(0, deadline - loop.time()))
             
             return follower_data
                     
@@ -892,6 +1439,24 @@ class TwitterScraper:
     async def close(self):
         """Close the browser and clean up resources"""
         try:
+            if self._ticker_task:
+                self._ticker_task.cancel()
+                try:
+                    await self._ticker_task
+                except asyncio.CancelledError:
+                    pass
+                self._ticker_task = None
+            if self._http and not self._http.closed:
+                await self._http.close()
+            if self._history_db:
+                self._history_db.close()
+                self._history_db = None
+            if self._leaderboard_context:
+                await self._leaderboard_context.close()
+                self._leaderboard_context = None
+                self._leaderboard_pages = None
+            if self._profile_pages:
+                await self._profile_pages.close()
             if self.page:
                 await self.page.close()
             if self.context:
@@ -919,27 +1484,13 @@ class TwitterScraper:
             "chainlink"
         ]
 
-def main():
-    # Example usage
-    scraper = TwitterScraper()
-    
-    # List of tokens to analyze from the provided list
-    tokens = [
-        "solana",  # @solana
-        "BNBCHAIN",  # @BNBCHAIN
-        "arbitrum",  # @arbitrum
-        "avalancheavax",  # @avalancheavax
-        "0xPolygon",  # @0xPolygon
-        "optimismFND",  # @optimismFND
-        "Cardano",  # @Cardano
-        "Polkadot",  # @Polkadot
-        "chainlink",  # @chainlink
-        "tezos"  # @tezos
-    ]
+async def run_leaderboard(tokens):
+    """Scrape the given tokens and print the leaderboard"""
+    scraper = await TwitterScraper.create()
     
     try:
         # Run live leaderboard with 5-minute updates
-        leaderboard_data, alerts = asyncio.run(scraper.generate_leaderboard(tokens))
+        leaderboard_data, alerts = await scraper.generate_leaderboard(tokens)
         
         if leaderboard_data:
             # Print leaderboard
@@ -947,26 +1498,63 @@ def main():
             print(f"{'#':<4} {'Username':<20} {'Followers':<12} {'Change':<8} {'Score':<8} Description\n")
             print("-" * 80)
             
+            # Format every row against one parsed spec, then write them at once
+            row = "{:<4} {:<20} {:<12} {:<8} {:<8} {}...\n\n".format
+            lines = []
             for i, entry in enumerate(leaderboard_data, 1):
-                followers = f"{entry['twitter_stats']['followers_count']:,}"
-                change = f"{entry['follower_metrics']['change_24h']:+d}" if entry['follower_metrics']['change_24h'] != 0 else "0"
-                score = str(entry['twitter_stats']['twitter_score'])
-                
-                print(f"{i:<4} {entry['token']:<20} {followers:<12} {change:<8} {score:<8} {entry['twitter_stats']['bio'][:50]}...\n")
+                stats = entry['twitter_stats']
+                change_24h = entry['follower_metrics']['change_24h']
+                lines.append(row(
+                    i,
+                    entry['token'],
+                    f"{stats['followers_count']:,}",
+                    f"{change_24h:+d}" if change_24h != 0 else "0",
+                    str(stats['twitter_score']),
+                    stats['bio'][:50]
+                ))
+            sys.stdout.writelines(lines)
             
             # Print alerts
             if alerts:
                 print("\nAlerts:")
                 for alert in alerts:
                     print(alert)
-            
-    except KeyboardInterrupt:
-        print("\nExiting...")
     finally:
         try:
-            asyncio.run(scraper.close())
+            await scraper.close()
         except:
             pass
 
+def main():
+    # Example usage
+    # List of tokens to analyze from the provided list
+    tokens = [
+        "solana",  # @solana
+        "BNBCHAIN",  # @BNBCHAIN
+        "arbitrum",  # @arbitrum
+        "avalancheavax",  # @avalancheavax
+        "0xPolygon",  # @0xPolygon
+        "optimismFND",  # @optimismFND
+        "Cardano",  # @Cardano
+        "Polkadot",  # @Polkadot
+        "chainlink",  # @chainlink
+        "tezos"  # @tezos
+    ]
+    
+    # Prefer uvloop's event loop where it is available (not on Windows)
+    run = asyncio.run
+    if sys.platform != 'win32':
+        try:
+            import uvloop
+            run = uvloop.run
+        except ImportError:
+            pass
+    
+    try:
+        # Run scraping, printing and cleanup on one event loop
+        run(run_leaderboard(tokens))
+    except KeyboardInterrupt:
+        print("\nExiting...")
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()